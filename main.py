@@ -8,12 +8,13 @@ import logging
 import random
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
-from queue import Queue
+from queue import SimpleQueue
+from typing import Callable, Dict, List, Optional, Tuple
 
-from src.models.machine import Machine, MachineMessage
+from src.models.machine import Machine, MachineMessage, _to_ns
 from src.models.yard import Yard, YardStatus
 from src.services.cleaning_service import CleaningService
 from src.services.logging_service import setup_logging
@@ -33,19 +34,24 @@ class MessageTransmissionSimulator:
                  message_interval: float = 1.0,
                  loss_rate: float = 0.06,
                  coordinate_error_rate: float = 0.015,
-                 max_delay: float = 2.0):
+                 max_delay: float = 2.0,
+                 seed: Optional[int] = None):
         """
         Args:
             message_interval: Интервал между сообщениями (секунды)
             loss_rate: Процент потерянных сообщений (0.06 = 6%)
             coordinate_error_rate: Процент сообщений с ошибками координат
             max_delay: Максимальная задержка доставки (секунды)
+            seed: Сид генератора случайных чисел (None - случайный)
         """
         self.message_interval = message_interval
         self.loss_rate = loss_rate
         self.coordinate_error_rate = coordinate_error_rate
         self.max_delay = max_delay
         
+        # Собственный генератор не зависит от глобального состояния random
+        self._random = random.Random(seed)
+        
         # Статистика
         self.total_generated = 0
         self.total_lost = 0
@@ -53,96 +59,163 @@ class MessageTransmissionSimulator:
         self.total_with_errors = 0
         self.logger = logging.getLogger('cleaning_system')
     
-    def simulate_transmission(self, messages: List[Dict], message_queue: Queue, 
-                            processing_speed: float = 1.0):
+    def simulate_transmission(self, messages: List[Dict],
+                            deliver: Callable[[List[Dict]], None],
+                            processing_speed: float = 1.0, batch_size: int = 32,
+                            batch_timeout: float = 0.5):
         """
         Симуляция передачи сообщений в реальном времени
         
+        Сообщения доставляются пачками: пачка отправляется, когда
+        набрано batch_size сообщений или с момента ее начала прошло
+        batch_timeout секунд (срок соблюдается и во время ожидания
+        следующего сообщения)
+        
         Args:
             messages: Список исходных сообщений
-            message_queue: Очередь для передачи сообщений
+            deliver: Получатель пачек сообщений (обработчик или очередь)
             processing_speed: Множитель скорости (1.0 = реальное время)
+            batch_size: Максимальный размер пачки сообщений
+            batch_timeout: Максимальное время накопления пачки (секунды)
         """
         self.logger.info(f"📡 Начало симуляции передачи {len(messages)} сообщений")
         self.logger.info(f"⚙️ Параметры: интервал={self.message_interval/processing_speed:.2f}с, "
                         f"потери={self.loss_rate*100:.1f}%, ошибки={self.coordinate_error_rate*100:.1f}%")
         
+        # Часто вызываемые функции связываем с локальными именами
+        rand = self._random.random
+        uniform = self._random.uniform
+        sleep = time.sleep
+        monotonic = time.monotonic
+        
+        # Потери и ошибки координат разыгрываются заранее для всех сообщений
+        lost_flags = [rand() < self.loss_rate for _ in range(len(messages))]
+        coordinate_errors = self._draw_coordinate_errors(len(messages))
+        
+        batch: List[Dict] = []
+        batch_started = 0.0
+        
+        # Накопленное ожидание (секунды симуляции), выполняемое одним вызовом sleep
+        pending_wait = 0.0
+        
         for i, message in enumerate(messages):
             self.total_generated += 1
             
             # Симуляция потери сообщения
-            if random.random() < self.loss_rate:
+            if lost_flags[i]:
                 self.total_lost += 1
-                self.logger.debug(f"📉 Сообщение #{i+1} от машины {message['machine_id']} потеряно при передаче")
+                self.logger.debug("📉 Сообщение #%d от машины %s потеряно при передаче",
+                                  i + 1, message['machine_id'])
                 # Ждем интервал даже для потерянного сообщения
-                time.sleep(random.uniform(0.5, self.message_interval) / processing_speed)
+                pending_wait += uniform(0.5, self.message_interval)
                 continue
             
             # Симуляция задержки передачи
-            transmission_delay = random.uniform(0, self.max_delay)
+            transmission_delay = uniform(0, self.max_delay)
             if transmission_delay > 0.8:
                 self.total_delayed += 1
-                self.logger.debug(f"⏱️ Сообщение #{i+1} задержано на {transmission_delay:.1f}с")
+                self.logger.debug("⏱️ Сообщение #%d задержано на %.1fс", i + 1, transmission_delay)
             
-            # Создаем копию сообщения для модификации
-            processed_message = message.copy()
-            
-            # Симуляция ошибок в координатах
-            if random.random() < self.coordinate_error_rate:
+            # Симуляция ошибок в координатах (копия создается только для искаженных сообщений)
+            coordinate_error = coordinate_errors[i]
+            if coordinate_error is not None:
                 self.total_with_errors += 1
-                processed_message = self._add_coordinate_error(processed_message)
-                self.logger.debug(f" Сообщение #{i+1} содержит ошибку координат")
-            
-            # Добавляем реальную задержку передачи
-            time.sleep(transmission_delay / processing_speed)
-            
-            # Помещаем сообщение в очередь
-            message_queue.put(processed_message)
-            
-            # Интервал между сообщениями (с небольшой случайностью)
-            actual_interval = random.uniform(
+                processed_message = self._add_coordinate_error(message.copy(), coordinate_error)
+                self.logger.debug(" Сообщение #%d содержит ошибку координат", i + 1)
+            else:
+                processed_message = message
+            
+            # Выдерживаем накопленный интервал и задержку передачи одной паузой
+            wait = (pending_wait + transmission_delay) / processing_speed
+            
+            # Если срок накопления пачки истекает раньше прихода сообщения,
+            # пачка отправляется по сроку, а не вместе со следующим сообщением
+            if batch:
+                remaining = batch_started + batch_timeout - monotonic()
+                if remaining < wait:
+                    if remaining > 0:
+                        sleep(remaining)
+                        wait -= remaining
+                    deliver(batch)
+                    batch = []
+            
+            sleep(wait)
+            
+            # Добавляем сообщение в текущую пачку
+            if not batch:
+                batch_started = monotonic()
+            batch.append(processed_message)
+            
+            # Отправляем пачку, если она заполнена или накапливается слишком долго
+            if len(batch) >= batch_size or monotonic() - batch_started >= batch_timeout:
+                deliver(batch)
+                batch = []
+            
+            # Интервал до следующего сообщения (с небольшой случайностью)
+            pending_wait = uniform(
                 self.message_interval * 0.8, 
                 self.message_interval * 1.2
             )
-            time.sleep(actual_interval / processing_speed)
         
-        # Сигнал окончания передачи
-        message_queue.put(None)
+        # Отправляем остаток пачки
+        if batch:
+            deliver(batch)
+        
         self.logger.info(f"📡 Передача завершена. Потеряно: {self.total_lost}/{self.total_generated}")
     
-    def _add_coordinate_error(self, message: Dict) -> Dict:
+    def _draw_coordinate_errors(self, count: int) -> List[Optional[Tuple[float, ...]]]:
         """
-        Добавление ошибки в координаты сообщения
+        Предварительный розыгрыш ошибок координат для пачки сообщений
+        
+        Каждая ошибка задается аффинным преобразованием
+        x' = a*x + b*y + dx, y' = c*x + d*y + dy, поэтому все типы ошибок
+        (смещение, шум, перестановка, масштабирование) применяются одной формулой
+        
+        Args:
+            count: Количество сообщений
+            
+        Returns:
+            Список коэффициентов (a, b, c, d, dx, dy) или None для сообщений без ошибки
+        """
+        rand = self._random.random
+        uniform = self._random.uniform
+        errors: List[Optional[Tuple[float, ...]]] = []
+        
+        for _ in range(count):
+            if rand() >= self.coordinate_error_rate:
+                errors.append(None)
+                continue
+            
+            error_type = self._random.randrange(4)
+            if error_type == 0:
+                # Случайное смещение
+                errors.append((1.0, 0.0, 0.0, 1.0, uniform(-8, 8), uniform(-8, 8)))
+            elif error_type == 1:
+                # Добавление шума
+                errors.append((1.0, 0.0, 0.0, 1.0, uniform(-4, 4), uniform(-4, 4)))
+            elif error_type == 2:
+                # Перестановка координат
+                errors.append((0.0, 1.0, 1.0, 0.0, 0.0, 0.0))
+            else:
+                # Неправильное масштабирование
+                scale = uniform(0.85, 1.15)
+                errors.append((scale, 0.0, 0.0, scale, 0.0, 0.0))
+        
+        return errors
+    
+    def _add_coordinate_error(self, message: Dict, error: Tuple[float, ...]) -> Dict:
         """
-        # Разные типы ошибок
-        error_type = random.choice(['offset', 'noise', 'swap', 'scale'])
+        Применение заранее разыгранной ошибки к координатам сообщения
         
+        Args:
+            message: Сообщение для изменения
+            error: Коэффициенты преобразования (a, b, c, d, dx, dy)
+        """
+        a, b, c, d, dx, dy = error
         x, y = message['x'], message['y']
         
-        if error_type == 'offset':
-            # Случайное смещение
-            offset_x = random.uniform(-8, 8)
-            offset_y = random.uniform(-8, 8)
-            message['x'] = round(x + offset_x, 2)
-            message['y'] = round(y + offset_y, 2)
-            
-        elif error_type == 'noise':
-            # Добавление шума
-            noise_x = random.uniform(-4, 4)
-            noise_y = random.uniform(-4, 4)
-            message['x'] = round(x + noise_x, 2)
-            message['y'] = round(y + noise_y, 2)
-            
-        elif error_type == 'swap':
-            # Перестановка координат
-            message['x'] = round(y, 2)
-            message['y'] = round(x, 2)
-            
-        elif error_type == 'scale':
-            # Неправильное масштабирование
-            scale = random.uniform(0.85, 1.15)
-            message['x'] = round(x * scale, 2)
-            message['y'] = round(y * scale, 2)
+        message['x'] = round(a * x + b * y + dx, 2)
+        message['y'] = round(c * x + d * y + dy, 2)
         
         return message
     
@@ -172,7 +245,7 @@ class CleaningMonitoringSystem:
     """
     
     def __init__(self, debug_mode: bool = False, realtime_mode: bool = False, 
-                 processing_speed: float = 1.0):
+                 processing_speed: float = 1.0, threaded_mode: bool = False):
         """
         Инициализация системы мониторинга
         
@@ -180,31 +253,84 @@ class CleaningMonitoringSystem:
             debug_mode: Режим отладки для подробного логирования
             realtime_mode: Режим реального времени с симуляцией передачи
             processing_speed: Множитель скорости обработки
+            threaded_mode: Обрабатывать сообщения реального времени в отдельном
+                потоке через очередь (по умолчанию - в потоке симулятора)
         """
         # Получаем системный логгер (он возвращает CleaningSystemLogger)
-        system_logger = setup_logging(debug_mode)
+        self.system_logger = setup_logging(debug_mode)
         # Извлекаем обычный logger из системного логгера
-        self.logger = system_logger.logger
+        self.logger = self.system_logger.logger
         
         self.cleaning_service = CleaningService(self.logger)
         self.file_handler = FileHandler(self.logger)
         self.machines: Dict[int, Machine] = {}
         self.yards: Dict[int, Yard] = {}
-        self.status_changes: List[Dict] = []
+        
+        # Изменения статусов дворов хранятся по столбцам (структура массивов):
+        # параллельные списки вместо отдельного словаря на каждое изменение
+        self._sc_yard: List[int] = []
+        self._sc_old: List[YardStatus] = []
+        self._sc_new: List[YardStatus] = []
+        self._sc_ts: List[str] = []
+        self._sc_machine: List[int] = []
+        self._sc_work_time: List[float] = []
         
         # Настройки режима работы
         self.realtime_mode = realtime_mode
         self.processing_speed = processing_speed
+        self.threaded_mode = threaded_mode
         
-        # Для режима реального времени
-        self.message_queue = Queue()
-        self.processing_active = False
+        # Для режима реального времени с потоком-обработчиком
+        # (SimpleQueue без учета незавершенных задач, передача без лишних блокировок)
+        self.message_queue: SimpleQueue = SimpleQueue()
         self.processed_messages = 0
-        self.start_time = None
+        self.start_time: Optional[float] = None  # Момент запуска по time.monotonic()
+        
+        # Количество машин, находящихся во дворах (обновляется при каждом сообщении)
+        self.active_machine_count = 0
         
         mode_text = "реального времени" if realtime_mode else "пакетной обработки"
         self.logger.info(f" Система мониторинга уборочных машин запущена в режиме {mode_text}")
     
+    @property
+    def status_changes(self) -> List[Dict]:
+        """
+        Изменения статусов дворов в виде списка словарей
+        
+        Словари собираются по запросу из столбцового хранилища
+        
+        Returns:
+            Список изменений статусов в порядке их возникновения
+        """
+        return [
+            {
+                'yard_id': yard_id,
+                'old_status': old_status,
+                'new_status': new_status,
+                'timestamp': timestamp,
+                'machine_id': machine_id,
+                'work_time_added': work_time
+            }
+            for yard_id, old_status, new_status, timestamp, machine_id, work_time in zip(
+                self._sc_yard, self._sc_old, self._sc_new,
+                self._sc_ts, self._sc_machine, self._sc_work_time
+            )
+        ]
+    
+    def _record_status_change(self, status_change: Dict):
+        """
+        Сохранение изменения статуса двора в столбцовое хранилище
+        
+        Args:
+            status_change: Информация об изменении статуса от CleaningService
+        """
+        self._sc_yard.append(status_change['yard_id'])
+        self._sc_old.append(status_change['old_status'])
+        self._sc_new.append(status_change['new_status'])
+        self._sc_ts.append(status_change['timestamp'])
+        self._sc_machine.append(status_change['machine_id'])
+        self._sc_work_time.append(status_change['work_time_added'])
+    
     def load_yard_directory(self, yard_file_path: str) -> bool:
         """
         Загрузка справочника дворов из файла
@@ -257,7 +383,7 @@ class CleaningMonitoringSystem:
             messages = self.file_handler.load_machine_messages(messages_file_path)
             
             # Сортируем сообщения по времени для корректной обработки
-            messages.sort(key=lambda x: x['timestamp'])
+            messages = self._sort_messages_by_time(messages)
             
             if self.realtime_mode:
                 return self._process_messages_realtime(messages)
@@ -268,12 +394,49 @@ class CleaningMonitoringSystem:
             self.logger.error(f" Ошибка обработки сообщений: {e}")
             return False
     
+    def _sort_messages_by_time(self, messages: List[Dict]) -> List[Dict]:
+        """
+        Сортировка сообщений по времени отправки
+        
+        Временные метки разбираются один раз и переводятся в целые наносекунды,
+        поэтому наивные метки и метки с часовым поясом сравниваются без ошибок.
+        Разобранное время сохраняется в сообщении под ключом '_ts' и
+        повторно используется при обработке.
+        
+        Сообщения с неразбираемым временем не отбрасываются: они помещаются
+        в конец списка и отклоняются при обработке, как и раньше, поэтому
+        входят в общее число сообщений в итоговой статистике
+        
+        Args:
+            messages: Список сообщений
+            
+        Returns:
+            Новый список сообщений, упорядоченный по времени
+        """
+        sort_keys = []
+        valid_messages = []
+        invalid_messages = []
+        
+        for message_data in messages:
+            try:
+                timestamp = datetime.fromisoformat(message_data['timestamp'])
+            except (TypeError, ValueError):
+                invalid_messages.append(message_data)
+                continue
+            message_data['_ts'] = timestamp
+            sort_keys.append(_to_ns(timestamp))
+            valid_messages.append(message_data)
+        
+        order = sorted(range(len(valid_messages)), key=sort_keys.__getitem__)
+        sorted_messages = [valid_messages[i] for i in order]
+        sorted_messages.extend(invalid_messages)
+        return sorted_messages
+    
     def _process_messages_batch(self, messages: List[Dict]) -> bool:
         """Пакетная обработка сообщений (оригинальный режим)"""
-        processed_count = 0
-        for message_data in messages:
-            if self._process_single_message(message_data):
-                processed_count += 1
+        # Цикл по сообщениям выполняется внутри map/sum на уровне C;
+        # успешно обработанные сообщения (True) суммируются как единицы
+        processed_count = sum(map(self._process_single_message, messages))
         
         self.logger.info(f" Обработано {processed_count} из {len(messages)} сообщений")
         return True
@@ -288,71 +451,103 @@ class CleaningMonitoringSystem:
             max_delay=2.0
         )
         
-        # Запускаем обработчик сообщений в отдельном потоке
-        self.processing_active = True
-        self.start_time = datetime.now()
+        self.start_time = time.monotonic()
         
+        if self.threaded_mode:
+            self._run_threaded_transmission(simulator, messages)
+        else:
+            # Обработка выполняется в потоке симулятора сразу при доставке:
+            # работа с сообщениями упирается в GIL, и отдельный поток
+            # добавил бы только расходы на синхронизацию
+            simulator.simulate_transmission(
+                messages, self._process_batch, self.processing_speed, batch_size=1
+            )
+        
+        # Выводим статистику передачи
+        transmission_stats = simulator.get_transmission_stats()
+        self._print_transmission_stats(transmission_stats)
+        
+        self.logger.info(f" Обработано {self.processed_messages} сообщений в режиме реального времени")
+        return True
+    
+    def _run_threaded_transmission(self, simulator: MessageTransmissionSimulator,
+                                   messages: List[Dict]):
+        """
+        Симуляция передачи с обработкой в отдельном потоке через очередь
+        
+        Args:
+            simulator: Симулятор передачи сообщений
+            messages: Список исходных сообщений
+        """
         processor_thread = threading.Thread(
             target=self._message_processor_worker,
             daemon=True
         )
         processor_thread.start()
         
-        # Запускаем симуляцию передачи сообщений
-        simulator.simulate_transmission(messages, self.message_queue, self.processing_speed)
+        try:
+            simulator.simulate_transmission(
+                messages, self.message_queue.put, self.processing_speed
+            )
+        finally:
+            # Сигнал окончания передачи отправляется всегда, чтобы обработчик не завис
+            self.message_queue.put(None)
         
-        # Ждем завершения обработки всех сообщений
-        self.message_queue.join()
-        self.processing_active = False
+        # Ждем, пока обработчик дойдет до сигнала окончания
+        processor_thread.join()
+    
+    def _process_batch(self, batch: List[Dict]):
+        """
+        Обработка пачки доставленных сообщений
         
-        # Выводим статистику передачи
-        transmission_stats = simulator.get_transmission_stats()
-        self._print_transmission_stats(transmission_stats)
+        Args:
+            batch: Пачка сообщений
+        """
+        progress_step = self.processed_messages // 5
+        process = self._process_single_message
         
-        self.logger.info(f" Обработано {self.processed_messages} сообщений в режиме реального времени")
-        return True
+        processed = 0
+        for message in batch:
+            if process(message):
+                processed += 1
+        self.processed_messages += processed
+        
+        # Выводим прогресс каждые 5 сообщений (не чаще одного раза на пачку)
+        if self.processed_messages // 5 != progress_step:
+            self._print_progress()
     
     def _message_processor_worker(self):
-        """Обработчик сообщений в отдельном потоке (имитация работы с очередью)"""
-        progress_counter = 0
+        """
+        Обработчик сообщений в отдельном потоке (имитация работы с очередью)
         
-        while self.processing_active:
+        Работает до получения сигнала окончания (None), который производитель
+        отправляет всегда, в том числе при ошибке симуляции
+        """
+        get = self.message_queue.get
+        process_batch = self._process_batch
+        
+        while True:
+            # Ожидаем пачку сообщений из очереди
+            batch = get()
+            
+            # Проверяем сигнал окончания
+            if batch is None:
+                break
+            
             try:
-                # Получаем сообщение из очереди
-                message = self.message_queue.get(timeout=1.0)
-                
-                # Проверяем сигнал окончания
-                if message is None:
-                    self.message_queue.task_done()
-                    break
-                
-                # Обрабатываем сообщение
-                if self._process_single_message(message):
-                    self.processed_messages += 1
-                    progress_counter += 1
-                    
-                    # Выводим прогресс каждые 5 сообщений
-                    if progress_counter % 5 == 0:
-                        self._print_progress()
-                
-                # Отмечаем задачу как выполненную
-                self.message_queue.task_done()
-                
-            except:
-                # Таймаут или другая ошибка - продолжаем
-                continue
+                process_batch(batch)
+            except Exception:
+                self.logger.exception(" Ошибка обработки пачки сообщений")
     
     def _print_progress(self):
         """Вывод прогресса обработки в реальном времени"""
-        if self.start_time:
-            elapsed = (datetime.now() - self.start_time).total_seconds()
+        if self.start_time is not None:
+            elapsed = time.monotonic() - self.start_time
             rate = self.processed_messages / elapsed if elapsed > 0 else 0
             
-            active_machines = sum(1 for m in self.machines.values() if m.current_yard_id)
-            
             self.logger.info(f"📊 Обработано: {self.processed_messages} сообщений | "
                            f"Скорость: {rate:.1f} сообщ/сек | "
-                           f"Активных машин: {active_machines}/{len(self.machines)}")
+                           f"Активных машин: {self.active_machine_count}/{len(self.machines)}")
     
     def _print_transmission_stats(self, stats: Dict):
         """Вывод статистики передачи"""
@@ -376,28 +571,39 @@ class CleaningMonitoringSystem:
             True если сообщение обработано успешно
         """
         try:
-            # Создаем объект сообщения
-            message = MachineMessage(
+            # Используем время, разобранное при сортировке, если оно есть
+            timestamp = message_data.get('_ts')
+            if timestamp is None:
+                timestamp = datetime.fromisoformat(message_data['timestamp'])
+            
+            # Создаем объект сообщения (данные из файла проверяются)
+            message = MachineMessage.checked(
                 machine_id=message_data['machine_id'],
-                timestamp=datetime.fromisoformat(message_data['timestamp']),
+                timestamp=timestamp,
                 coordinates=(message_data['x'], message_data['y']),
                 yard_id=message_data.get('yard_id')
             )
             
             # Получаем или создаем машину
-            if message.machine_id not in self.machines:
-                self.machines[message.machine_id] = Machine(message.machine_id)
-                self.logger.debug(f"🚚 Новая машина зарегистрирована: ID={message.machine_id}")
+            machine = self.machines.get(message.machine_id)
+            if machine is None:
+                machine = self.machines[message.machine_id] = Machine(message.machine_id)
+                self.logger.debug("🚚 Новая машина зарегистрирована: ID=%d", message.machine_id)
             
-            machine = self.machines[message.machine_id]
+            was_active = machine.current_yard_id is not None
             
             # Обновляем состояние машины и проверяем изменения статуса дворов
             status_change = self.cleaning_service.process_machine_update(
                 machine, message, self.yards
             )
             
+            # Поддерживаем счетчик активных машин без полного пересчета
+            is_active = machine.current_yard_id is not None
+            if is_active != was_active:
+                self.active_machine_count += 1 if is_active else -1
+            
             if status_change:
-                self.status_changes.append(status_change)
+                self._record_status_change(status_change)
                 self.logger.info(
                     f"🎯 Изменение статуса двора {status_change['yard_id']}: "
                     f"{status_change['old_status']} -> {status_change['new_status']}"
@@ -409,12 +615,22 @@ class CleaningMonitoringSystem:
             self.logger.error(f" Ошибка обработки сообщения: {e}")
             return False
     
-    def generate_output_files(self, output_dir: str = "output") -> bool:
+    def close(self):
+        """
+        Завершение работы системы
+        
+        Дописывает накопленные в очереди логи, чтобы последующий вывод
+        в консоль не перемешивался с сообщениями фонового потока
+        """
+        self.system_logger.close()
+    
+    def generate_output_files(self, output_dir: str = "output", json_report: bool = False) -> bool:
         """
         Генерация выходных файлов с результатами
         
         Args:
             output_dir: Директория для сохранения файлов
+            json_report: Дополнительно сохранить сводный отчет в формате JSON
             
         Returns:
             True если файлы созданы успешно
@@ -424,17 +640,37 @@ class CleaningMonitoringSystem:
             
             Path(output_dir).mkdir(exist_ok=True)
             
-            # Файл с изменениями статусов дворов
-            yard_status_file = Path(output_dir) / "yard_status_changes.txt"
-            self._write_yard_status_changes(yard_status_file)
+            writers = [
+                # Файл с изменениями статусов дворов
+                (self._write_yard_status_changes, Path(output_dir) / "yard_status_changes.txt"),
+                # Файл с финальными позициями машин
+                (self._write_final_machine_positions, Path(output_dir) / "final_machine_positions.txt"),
+                # Сводный отчет
+                (self._write_summary_report, Path(output_dir) / "summary_report.txt")
+            ]
+            
+            if json_report:
+                # Сводный отчет для автоматической обработки
+                writers.append(
+                    (self._write_summary_report_json, Path(output_dir) / "summary_report.json")
+                )
+            
+            # Файлы независимы и только читают итоговое состояние, поэтому
+            # записываются параллельно
+            with ThreadPoolExecutor(max_workers=len(writers)) as executor:
+                futures = [
+                    (file_path, executor.submit(writer, file_path))
+                    for writer, file_path in writers
+                ]
             
-            # Файл с финальными позициями машин
-            machine_positions_file = Path(output_dir) / "final_machine_positions.txt"
-            self._write_final_machine_positions(machine_positions_file)
+            errors = []
+            for file_path, future in futures:
+                error = future.exception()
+                if error is not None:
+                    errors.append(f"{file_path.name}: {error}")
             
-            # Сводный отчет
-            summary_file = Path(output_dir) / "summary_report.txt"
-            self._write_summary_report(summary_file)
+            if errors:
+                raise OSError("; ".join(errors))
             
             self.logger.info(" Выходные файлы созданы успешно")
             return True
@@ -445,64 +681,74 @@ class CleaningMonitoringSystem:
     
     def _write_yard_status_changes(self, file_path: Path):
         """Запись изменений статусов дворов в файл"""
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write("# Изменения статусов дворов\n")
-            f.write("# Формат: ID_двора,Статус,Время_изменения\n\n")
-            
-            if not self.status_changes:
-                f.write("# Изменений статусов не зафиксировано\n")
-                return
-            
-            for change in self.status_changes:
-                f.write(
-                    f"{change['yard_id']},"
-                    f"{change['new_status'].value}%,"
-                    f"{change['timestamp']}\n"
-                )
+        parts = [
+            "# Изменения статусов дворов\n",
+            "# Формат: ID_двора,Статус,Время_изменения\n\n"
+        ]
+        
+        if not self._sc_yard:
+            parts.append("# Изменений статусов не зафиксировано\n")
+        else:
+            parts.extend(
+                f"{yard_id},{new_status.value}%,{timestamp}\n"
+                for yard_id, new_status, timestamp in zip(self._sc_yard, self._sc_new, self._sc_ts)
+            )
+        
+        # Кодируем весь текст один раз и пишем без текстовой обертки
+        with open(file_path, 'wb') as f:
+            f.write("".join(parts).encode('utf-8'))
     
     def _write_final_machine_positions(self, file_path: Path):
         """Запись финальных позиций машин в файл"""
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write("# Финальные позиции машин\n")
-            f.write("# Формат: ID_машины,X,Y,ID_двора\n\n")
-            
-            for machine in self.machines.values():
-                yard_id = machine.current_yard_id if machine.current_yard_id else ""
-                f.write(
-                    f"{machine.machine_id},"
-                    f"{machine.current_coordinates[0]},"
-                    f"{machine.current_coordinates[1]},"
-                    f"{yard_id}\n"
-                )
+        parts = [
+            "# Финальные позиции машин\n",
+            "# Формат: ID_машины,X,Y,ID_двора\n\n"
+        ]
+        
+        for machine in self.machines.values():
+            yard_id = machine.current_yard_id if machine.current_yard_id else ""
+            x, y = machine.current_coordinates
+            parts.append(f"{machine.machine_id},{x},{y},{yard_id}\n")
+        
+        with open(file_path, 'wb') as f:
+            f.write("".join(parts).encode('utf-8'))
     
     def _write_summary_report(self, file_path: Path):
         """Создание сводного отчета"""
+        parts = [
+            "=== СВОДНЫЙ ОТЧЕТ СИСТЕМЫ МОНИТОРИНГА ===\n\n",
+            f"Общее количество машин: {len(self.machines)}\n",
+            f"Общее количество дворов: {len(self.yards)}\n",
+            f"Изменений статусов: {len(self._sc_yard)}\n"
+        ]
+        
+        if self.realtime_mode:
+            parts.append(f"Режим работы: Реальное время (скорость x{self.processing_speed})\n")
+            parts.append(f"Обработано сообщений: {self.processed_messages}\n")
+        else:
+            parts.append("Режим работы: Пакетная обработка\n")
+        
+        parts.append("\n=== СТАТИСТИКА ПО ДВОРАМ ===\n")
+        for yard in self.yards.values():
+            progress = (yard.cleaned_area / yard.area * 100) if yard.area > 0 else 0
+            parts.append(
+                f"Двор {yard.yard_id}: {progress:.1f}% убрано "
+                f"(статус: {yard.status.value}%)\n"
+            )
+        
+        parts.append("\n=== АКТИВНЫЕ МАШИНЫ ===\n")
+        for machine in self.machines.values():
+            status = f"во дворе {machine.current_yard_id}" if machine.current_yard_id else "вне дворов"
+            parts.append(f"Машина {machine.machine_id}: {status}\n")
+        
         with open(file_path, 'w', encoding='utf-8') as f:
-            f.write("=== СВОДНЫЙ ОТЧЕТ СИСТЕМЫ МОНИТОРИНГА ===\n\n")
-            
-            f.write(f"Общее количество машин: {len(self.machines)}\n")
-            f.write(f"Общее количество дворов: {len(self.yards)}\n")
-            f.write(f"Изменений статусов: {len(self.status_changes)}\n")
-            
-            if self.realtime_mode:
-                f.write(f"Режим работы: Реальное время (скорость x{self.processing_speed})\n")
-                f.write(f"Обработано сообщений: {self.processed_messages}\n")
-            else:
-                f.write("Режим работы: Пакетная обработка\n")
-            
-            f.write("\n=== СТАТИСТИКА ПО ДВОРАМ ===\n")
-            for yard in self.yards.values():
-                progress = (yard.cleaned_area / yard.area * 100) if yard.area > 0 else 0
-                f.write(
-                    f"Двор {yard.yard_id}: {progress:.1f}% убрано "
-                    f"(статус: {yard.status.value}%)\n"
-                )
-            
-            f.write("\n=== АКТИВНЫЕ МАШИНЫ ===\n")
-            for machine in self.machines.values():
-                status = f"во дворе {machine.current_yard_id}" if machine.current_yard_id else "вне дворов"
-                f.write(f"Машина {machine.machine_id}: {status}\n")
-
+            f.write("".join(parts))
+    
+    def _write_summary_report_json(self, file_path: Path):
+        """Создание сводного отчета в формате JSON"""
+        self.file_handler.save_summary_report_json(
+            self.machines, self.yards, self.status_changes, str(file_path)
+        )
 
 def main():
     """Главная функция программы"""
@@ -511,10 +757,14 @@ def main():
     parser = argparse.ArgumentParser(description='Система мониторинга уборочных машин')
     parser.add_argument('--debug', action='store_true', help='Режим отладки')
     parser.add_argument('--realtime', action='store_true', help='Режим реального времени с симуляцией передачи')
+    parser.add_argument('--threaded', action='store_true',
+                        help='Обработка сообщений реального времени в отдельном потоке через очередь')
     parser.add_argument('--speed', type=float, default=1.0, help='Множитель скорости для режима реального времени')
     parser.add_argument('--yards', default='data/yards.txt', help='Файл справочника дворов')
     parser.add_argument('--messages', default='data/machine_messages.json', help='Файл сообщений машин')
     parser.add_argument('--output', default='output', help='Директория для выходных файлов')
+    parser.add_argument('--json-report', action='store_true',
+                        help='Дополнительно сохранить сводный отчет в формате JSON')
     
     args = parser.parse_args()
     
@@ -522,24 +772,29 @@ def main():
     system = CleaningMonitoringSystem(
         debug_mode=args.debug, 
         realtime_mode=args.realtime,
-        processing_speed=args.speed
+        processing_speed=args.speed,
+        threaded_mode=args.threaded
     )
     
     # Загрузка справочника дворов
     if not system.load_yard_directory(args.yards):
+        system.close()
         print(" Ошибка загрузки справочника дворов")
         return 1
     
     # Обработка сообщений от машин
     if not system.process_machine_messages(args.messages):
+        system.close()
         print(" Ошибка обработки сообщений от машин")
         return 1
     
     # Генерация выходных файлов
-    if not system.generate_output_files(args.output):
+    if not system.generate_output_files(args.output, json_report=args.json_report):
+        system.close()
         print(" Ошибка создания выходных файлов")
         return 1
     
+    system.close()
     mode_text = "в режиме реального времени" if args.realtime else "в пакетном режиме"
     print(f" Обработка завершена успешно {mode_text}!")
     return 0
@@ -3,12 +3,13 @@
 Содержит классы для представления машин, дворов и связанных сущностей
 """
 
-from .machine import Machine, MachineMessage
+from .machine import Machine, MachineMessage, PositionChange
 from .yard import Yard, YardStatus
 
 __all__ = [
     'Machine',
     'MachineMessage', 
+    'PositionChange',
     'Yard',
     'YardStatus'
 ]
\ No newline at end of file
@@ -4,11 +4,36 @@
 """
 
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional, Tuple
+from datetime import datetime, timedelta, timezone
+from typing import NamedTuple, Optional, Tuple
 
 
-@dataclass
+# Начало отсчета для перевода меток времени в целые наносекунды
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+_NS_PER_SECOND = 1_000_000_000
+
+# Максимальный промежуток между сообщениями, засчитываемый как работа (1 час).
+# Отрицательные и более длинные промежутки считаются ошибками в данных
+_MAX_WORK_INTERVAL_NS = 3600 * _NS_PER_SECOND
+
+
+def _to_ns(timestamp: datetime) -> int:
+    """
+    Перевод метки времени в целое число наносекунд от начала эпохи
+    
+    Args:
+        timestamp: Метка времени (наивная или с часовым поясом)
+        
+    Returns:
+        Количество наносекунд (точность - микросекунды, как у datetime)
+    """
+    epoch = _EPOCH if timestamp.tzinfo is None else _EPOCH_UTC
+    return (timestamp - epoch) // _ONE_MICROSECOND * 1000
+
+
+@dataclass(slots=True)
 class MachineMessage:
     """
     Сообщение от уборочной машины
@@ -20,16 +45,55 @@ class MachineMessage:
     coordinates: Tuple[float, float]  # Координаты машины (x, y)
     yard_id: Optional[int] = None  # ID двора или None если машина вне дворов
     
-    def __post_init__(self):
-        """Валидация данных после инициализации"""
-        if self.machine_id <= 0:
+    @classmethod
+    def checked(
+        cls, 
+        machine_id: int, 
+        timestamp: datetime, 
+        coordinates: Tuple[float, float], 
+        yard_id: Optional[int] = None
+    ) -> 'MachineMessage':
+        """
+        Создание сообщения с проверкой данных
+        
+        Используется на границе приема данных из внешних источников;
+        доверенные производители могут вызывать конструктор напрямую
+        
+        Args:
+            machine_id: Идентификатор машины
+            timestamp: Время отправки сообщения
+            coordinates: Координаты машины (x, y)
+            yard_id: ID двора или None если машина вне дворов
+            
+        Returns:
+            Проверенное сообщение
+            
+        Raises:
+            ValueError: Если данные сообщения некорректны
+        """
+        if machine_id <= 0:
             raise ValueError("ID машины должен быть положительным числом")
         
-        if len(self.coordinates) != 2:
+        if len(coordinates) != 2:
             raise ValueError("Координаты должны содержать два значения (x, y)")
         
-        if self.yard_id is not None and self.yard_id <= 0:
+        if yard_id is not None and yard_id <= 0:
             raise ValueError("ID двора должен быть положительным числом")
+        
+        return cls(machine_id, timestamp, coordinates, yard_id)
+
+
+class PositionChange(NamedTuple):
+    """
+    Результат обновления позиции машины
+    
+    Описывает изменения, произошедшие после обработки одного сообщения
+    """
+    position_changed: bool  # Изменились ли координаты
+    yard_changed: bool  # Изменился ли двор
+    entered_yard: Optional[int]  # ID двора, в который въехала машина
+    left_yard: Optional[int]  # ID двора, который покинула машина (если была работа)
+    work_time_added: float  # Добавленное время работы в секундах
 
 
 class Machine:
@@ -43,6 +107,19 @@ class Machine:
     - Историю работы во дворах
     """
     
+    # Фиксированный набор атрибутов: без __dict__ у каждого экземпляра
+    __slots__ = (
+        'machine_id',
+        'current_coordinates',
+        'last_update',
+        'current_yard_id',
+        'previous_yard_id',
+        'yard_work_history',
+        '_last_update_ns',
+        '_yard_entry_ns',
+        '_update_yard'
+    )
+    
     def __init__(self, machine_id: int):
         """
         Инициализация машины
@@ -62,10 +139,16 @@ class Machine:
         # История работы во дворах: {yard_id: общее_время_работы}
         self.yard_work_history: dict[int, float] = {}
         
-        # Время входа в текущий двор (для расчета времени работы)
-        self._yard_entry_time: Optional[datetime] = None
+        # Время последнего сообщения и входа в текущий двор в наносекундах
+        # (для расчета времени работы без арифметики над datetime)
+        self._last_update_ns: Optional[int] = None
+        self._yard_entry_ns: Optional[int] = None
+        
+        # Обработчик сообщений для текущего состояния машины
+        # (переключается при въезде во двор и выезде из дворов)
+        self._update_yard = self._update_outside_yard
     
-    def update_position(self, message: MachineMessage) -> dict:
+    def update_position(self, message: MachineMessage) -> PositionChange:
         """
         Обновление позиции машины на основе полученного сообщения
         
@@ -73,94 +156,111 @@ class Machine:
             message: Сообщение от машины с новыми данными
             
         Returns:
-            Словарь с информацией об изменениях
-        """
-        changes = {
-            'position_changed': False,
-            'yard_changed': False,
-            'entered_yard': None,
-            'left_yard': None,
-            'work_time_added': 0.0
-        }
-        
-        # Проверяем изменение позиции
-        old_coordinates = self.current_coordinates
-        self.current_coordinates = message.coordinates
+            Информация об изменениях
+        """
+        timestamp = message.timestamp
+        timestamp_ns = _to_ns(timestamp)
         
-        if old_coordinates != message.coordinates:
-            changes['position_changed'] = True
+        # Проверяем изменение позиции (сравниваем координаты напрямую, без сравнения кортежей)
+        coordinates = message.coordinates
+        old_x, old_y = self.current_coordinates
+        new_x, new_y = coordinates
+        position_changed = new_x != old_x or new_y != old_y
+        self.current_coordinates = coordinates
         
-        # Обрабатываем изменение двора
-        if self.current_yard_id != message.yard_id:
-            changes['yard_changed'] = True
-            
-            # Если машина покидает двор, записываем время работы
-            if self.current_yard_id is not None and self._yard_entry_time is not None:
-                work_time = self._calculate_work_time(self.last_update, message.timestamp)
-                if work_time > 0:
-                    self._add_work_time(self.current_yard_id, work_time)
-                    changes['work_time_added'] = work_time
-                    changes['left_yard'] = self.current_yard_id
-            
-            # Обновляем информацию о дворе
-            self.previous_yard_id = self.current_yard_id
-            self.current_yard_id = message.yard_id
-            
-            # Если машина входит в новый двор
-            if message.yard_id is not None:
-                self._yard_entry_time = message.timestamp
-                changes['entered_yard'] = message.yard_id
-            else:
-                self._yard_entry_time = None
-        
-        # Если машина остается в том же дворе, обновляем время работы
-        elif (self.current_yard_id is not None and 
-              self.last_update is not None and 
-              self._yard_entry_time is not None):
-            
-            work_time = self._calculate_work_time(self.last_update, message.timestamp)
-            if work_time > 0:
-                self._add_work_time(self.current_yard_id, work_time)
-                changes['work_time_added'] = work_time
+        # Обработчик выбран заранее по состоянию машины (во дворе / вне дворов)
+        changes = self._update_yard(position_changed, message.yard_id, timestamp_ns)
         
-        self.last_update = message.timestamp
+        self.last_update = timestamp
+        self._last_update_ns = timestamp_ns
         return changes
     
-    def get_total_work_time_in_yard(self, yard_id: int) -> float:
+    def _update_outside_yard(
+        self, 
+        position_changed: bool, 
+        new_yard_id: Optional[int], 
+        timestamp_ns: int
+    ) -> PositionChange:
         """
-        Получение общего времени работы машины в указанном дворе
+        Обработка сообщения для машины, находящейся вне дворов
         
         Args:
-            yard_id: Идентификатор двора
+            position_changed: Изменились ли координаты
+            new_yard_id: Двор из сообщения
+            timestamp_ns: Время сообщения в наносекундах
             
         Returns:
-            Общее время работы в секундах
+            Информация об изменениях
         """
-        return self.yard_work_history.get(yard_id, 0.0)
+        # Машина остается вне дворов - время работы не начисляется
+        if new_yard_id is None:
+            return PositionChange(position_changed, False, None, None, 0.0)
+        
+        # Машина въезжает во двор
+        self.previous_yard_id = None
+        self.current_yard_id = new_yard_id
+        self._yard_entry_ns = timestamp_ns
+        self._update_yard = self._update_in_yard
+        return PositionChange(position_changed, True, new_yard_id, None, 0.0)
     
-    def _calculate_work_time(self, start_time: datetime, end_time: datetime) -> float:
+    def _update_in_yard(
+        self, 
+        position_changed: bool, 
+        new_yard_id: Optional[int], 
+        timestamp_ns: int
+    ) -> PositionChange:
         """
-        Расчет времени работы между двумя моментами времени
+        Обработка сообщения для машины, находящейся во дворе
         
         Args:
-            start_time: Время начала
-            end_time: Время окончания
+            position_changed: Изменились ли координаты
+            new_yard_id: Двор из сообщения
+            timestamp_ns: Время сообщения в наносекундах
             
         Returns:
-            Время работы в секундах
+            Информация об изменениях
         """
-        if start_time is None or end_time is None:
-            return 0.0
+        current_yard_id = self.current_yard_id
+        
+        # Время работы в текущем дворе с момента предыдущего сообщения
+        # (одинаково для выезда из двора и для продолжения работы в нем)
+        work_time = 0.0
+        delta_ns = timestamp_ns - self._last_update_ns
+        if 0 < delta_ns <= _MAX_WORK_INTERVAL_NS:
+            work_time = delta_ns / _NS_PER_SECOND
+            self._add_work_time(current_yard_id, work_time)
+        
+        # Машина продолжает работу в том же дворе
+        if new_yard_id == current_yard_id:
+            return PositionChange(position_changed, False, None, None, work_time)
+        
+        # Если машина покинула двор, в котором работала
+        left_yard = current_yard_id if work_time > 0 else None
         
-        time_diff = end_time - start_time
-        seconds = time_diff.total_seconds()
+        # Обновляем информацию о дворе
+        self.previous_yard_id = current_yard_id
+        self.current_yard_id = new_yard_id
         
-        # Игнорируем отрицательные значения и слишком большие промежутки
-        # (которые могут указывать на ошибки в данных)
-        if seconds < 0 or seconds > 3600:  # Более часа между сообщениями
-            return 0.0
+        # Машина переезжает в другой двор или выезжает за пределы дворов
+        if new_yard_id is not None:
+            self._yard_entry_ns = timestamp_ns
+        else:
+            self._yard_entry_ns = None
+            self._update_yard = self._update_outside_yard
         
-        return seconds
+        return PositionChange(position_changed, True, new_yard_id, left_yard, work_time)
+    
+    def get_total_work_time_in_yard(self, yard_id: int) -> float:
+        """
+        Получение общего времени работы машины в указанном дворе
+        
+        Args:
+            yard_id: Идентификатор двора
+            
+        Returns:
+            Общее время работы в секундах
+        """
+        return self.yard_work_history.get(yard_id, 0.0)
     
     def _add_work_time(self, yard_id: int, work_time: float):
         """
@@ -170,10 +270,8 @@ class Machine:
             yard_id: Идентификатор двора
             work_time: Время работы в секундах
         """
-        if yard_id not in self.yard_work_history:
-            self.yard_work_history[yard_id] = 0.0
-        
-        self.yard_work_history[yard_id] += work_time
+        history = self.yard_work_history
+        history[yard_id] = history.get(yard_id, 0.0) + work_time
     
     def get_current_status(self) -> dict:
         """
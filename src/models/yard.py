@@ -3,10 +3,17 @@
 Содержит классы для представления дворов и их статусов уборки
 """
 
+from bisect import bisect_right
+from math import inf, isfinite, nextafter
 from enum import Enum
 from typing import Optional
 
 
+# Максимальное число шагов на соседнее число с плавающей точкой при поиске
+# границы статуса; при превышении статус определяется сравнением процентов
+_MAX_BOUNDARY_STEPS = 64
+
+
 class YardStatus(Enum):
     """
     Статусы уборки двора
@@ -31,18 +38,8 @@ class YardStatus(Enum):
         Returns:
             Соответствующий статус уборки
         """
-        if percentage >= 100:
-            return cls.PERCENT_100
-        elif percentage >= 80:
-            return cls.PERCENT_80
-        elif percentage >= 60:
-            return cls.PERCENT_60
-        elif percentage >= 40:
-            return cls.PERCENT_40
-        elif percentage >= 20:
-            return cls.PERCENT_20
-        else:
-            return cls.PERCENT_0
+        # Число пройденных порогов совпадает с индексом статуса
+        return _STATUSES[bisect_right(_STATUS_THRESHOLDS, percentage)]
     
     def get_next_status(self) -> Optional['YardStatus']:
         """
@@ -51,25 +48,19 @@ class YardStatus(Enum):
         Returns:
             Следующий статус или None если это максимальный статус
         """
-        statuses = [
-            YardStatus.PERCENT_0,
-            YardStatus.PERCENT_20,
-            YardStatus.PERCENT_40,
-            YardStatus.PERCENT_60,
-            YardStatus.PERCENT_80,
-            YardStatus.PERCENT_100
-        ]
-        
-        try:
-            current_index = statuses.index(self)
-            if current_index < len(statuses) - 1:
-                return statuses[current_index + 1]
-        except ValueError:
-            pass
+        current_index = _STATUSES.index(self)
+        if current_index < len(_STATUSES) - 1:
+            return _STATUSES[current_index + 1]
         
         return None
 
 
+# Статусы в порядке возрастания и нижние границы (в процентах) всех статусов,
+# кроме нулевого. Объявлены вне перечисления, чтобы не стать его членами
+_STATUSES = tuple(YardStatus)
+_STATUS_THRESHOLDS = tuple(status.value for status in _STATUSES[1:])
+
+
 class Yard:
     """
     Класс представляющий двор для уборки
@@ -81,6 +72,18 @@ class Yard:
     - Общее время работы машин во дворе
     """
     
+    # Фиксированный набор атрибутов: без __dict__ у каждого экземпляра
+    __slots__ = (
+        'yard_id',
+        'area',
+        'cleaning_speed',
+        'status',
+        'cleaned_area',
+        'total_work_time',
+        'status_changes_count',
+        '_next_status_area'
+    )
+    
     def __init__(self, yard_id: int, area: float, cleaning_speed: float):
         """
         Инициализация двора
@@ -93,11 +96,11 @@ class Yard:
         if yard_id <= 0:
             raise ValueError("ID двора должен быть положительным числом")
         
-        if area <= 0:
-            raise ValueError("Площадь двора должна быть положительным числом")
+        if not isfinite(area) or area <= 0:
+            raise ValueError("Площадь двора должна быть положительным конечным числом")
         
-        if cleaning_speed <= 0:
-            raise ValueError("Скорость уборки должна быть положительным числом")
+        if not isfinite(cleaning_speed) or cleaning_speed <= 0:
+            raise ValueError("Скорость уборки должна быть положительным конечным числом")
         
         self.yard_id = yard_id
         self.area = area
@@ -108,8 +111,11 @@ class Yard:
         self.cleaned_area = 0.0
         self.total_work_time = 0.0
         
-        # История изменений статуса
-        self.status_history = [YardStatus.PERCENT_0]
+        # Количество изменений статуса (полная история не хранится)
+        self.status_changes_count = 0
+        
+        # Убранная площадь, при достижении которой статус сменится
+        self._next_status_area = self._get_next_status_area()
     
     def add_work_time(self, work_time: float) -> Optional[YardStatus]:
         """
@@ -135,18 +141,62 @@ class Yard:
         if self.cleaned_area > self.area:
             self.cleaned_area = self.area
         
-        # Определяем новый статус
-        percentage = self.get_completion_percentage()
-        new_status = YardStatus.get_status_by_percentage(percentage)
+        # Убранная площадь только растет, поэтому статус может измениться
+        # лишь после достижения порога следующего статуса (сравнение без деления)
+        if self.cleaned_area < self._next_status_area:
+            return None
         
-        # Проверяем, изменился ли статус
-        if new_status != self.status:
-            old_status = self.status
-            self.status = new_status
-            self.status_history.append(new_status)
-            return new_status
+        new_status = YardStatus.get_status_by_percentage(self.get_completion_percentage())
+        if new_status is self.status:
+            # Граница не была найдена точно, и порог сравнивается по процентам
+            return None
         
-        return None
+        self.status = new_status
+        self.status_changes_count += 1
+        self._next_status_area = self._get_next_status_area()
+        return new_status
+    
+    def _get_next_status_area(self) -> float:
+        """
+        Получение убранной площади, при которой сменится текущий статус
+        
+        Граница подбирается с точностью до соседнего числа с плавающей точкой,
+        чтобы сравнение площадей давало тот же результат, что и сравнение
+        процента из get_completion_percentage() с порогом статуса
+        
+        Returns:
+            Минимальная убранная площадь для следующего статуса (inf для максимального,
+            0.0 если границу не удалось найти за _MAX_BOUNDARY_STEPS шагов)
+        """
+        next_status = self.status.get_next_status()
+        if next_status is None:
+            return inf
+        
+        threshold = next_status.value
+        area = self.area
+        
+        def reaches(cleaned_area: float) -> bool:
+            return min((cleaned_area / area) * 100, 100.0) >= threshold
+        
+        boundary = threshold * area / 100
+        if not isfinite(boundary):
+            return 0.0
+        
+        steps = 0
+        while reaches(boundary):
+            boundary = nextafter(boundary, -inf)
+            steps += 1
+            if steps > _MAX_BOUNDARY_STEPS:
+                return 0.0
+        
+        steps = 0
+        while not reaches(boundary):
+            boundary = nextafter(boundary, inf)
+            steps += 1
+            if steps > _MAX_BOUNDARY_STEPS:
+                return 0.0
+        
+        return boundary
     
     def get_completion_percentage(self) -> float:
         """
@@ -190,7 +240,7 @@ class Yard:
         Returns:
             True если двор убран на 100%
         """
-        return self.status == YardStatus.PERCENT_100
+        return self.status is YardStatus.PERCENT_100
     
     def get_status_info(self) -> dict:
         """
@@ -210,7 +260,7 @@ class Yard:
             'total_work_time': self.total_work_time,
             'is_fully_cleaned': self.is_fully_cleaned(),
             'estimated_completion_time': self.get_estimated_completion_time(),
-            'status_changes_count': len(self.status_history) - 1
+            'status_changes_count': self.status_changes_count
         }
     
     def reset_cleaning_progress(self):
@@ -220,7 +270,8 @@ class Yard:
         self.cleaned_area = 0.0
         self.total_work_time = 0.0
         self.status = YardStatus.PERCENT_0
-        self.status_history = [YardStatus.PERCENT_0]
+        self.status_changes_count = 0
+        self._next_status_area = self._get_next_status_area()
     
     def __str__(self) -> str:
         """Строковое представление двора"""
@@ -7,7 +7,7 @@ import logging
 from datetime import datetime
 from typing import Dict, Optional
 
-from ..models.machine import Machine, MachineMessage
+from ..models.machine import Machine, MachineMessage, PositionChange
 from ..models.yard import Yard, YardStatus
 
 
@@ -54,51 +54,51 @@ class CleaningService:
         
         try:
             # Логируем получение сообщения
+            # (аргументы форматируются только если уровень DEBUG включен)
             self.logger.debug(
-                f"📨 Сообщение #{self._message_count} от машины {message.machine_id}: "
-                f"координаты=({message.coordinates[0]}, {message.coordinates[1]}), "
-                f"двор={message.yard_id}, время={message.timestamp}"
+                "📨 Сообщение #%d от машины %d: координаты=(%s, %s), двор=%s, время=%s",
+                self._message_count, message.machine_id,
+                message.coordinates[0], message.coordinates[1],
+                message.yard_id, message.timestamp
             )
             
             # Обновляем позицию машины
             changes = machine.update_position(message)
             
             # Логируем изменения позиции
-            if changes['position_changed']:
+            if changes.position_changed:
                 self.logger.debug(
-                    f"🚚 Машина {machine.machine_id} изменила позицию: "
-                    f"{message.coordinates}"
+                    "🚚 Машина %d изменила позицию: %s",
+                    machine.machine_id, message.coordinates
                 )
             
             # Обрабатываем изменения дворов
             status_change = None
             
-            if changes['yard_changed']:
+            if changes.yard_changed:
                 status_change = self._handle_yard_change(machine, changes, yards, message.timestamp)
             
             # Если машина работает в текущем дворе, обновляем статус
-            elif (changes['work_time_added'] > 0 and 
-                  machine.current_yard_id is not None and 
-                  machine.current_yard_id in yards):
-                
-                yard = yards[machine.current_yard_id]
-                old_status = yard.status
-                new_status = yard.add_work_time(changes['work_time_added'])
-                
-                if new_status:
-                    status_change = {
-                        'yard_id': yard.yard_id,
-                        'old_status': old_status,
-                        'new_status': new_status,
-                        'timestamp': message.timestamp.isoformat(),
-                        'machine_id': machine.machine_id,
-                        'work_time_added': changes['work_time_added']
-                    }
+            elif changes.work_time_added > 0:
+                yard = yards.get(machine.current_yard_id)
+                if yard is not None:
+                    old_status = yard.status
+                    new_status = yard.add_work_time(changes.work_time_added)
                     
-                    self.logger.info(
-                        f"📊 Машина {machine.machine_id} работала {changes['work_time_added']:.1f}с "
-                        f"во дворе {yard.yard_id}, убрано {yard.get_completion_percentage():.1f}%"
-                    )
+                    if new_status:
+                        status_change = {
+                            'yard_id': yard.yard_id,
+                            'old_status': old_status,
+                            'new_status': new_status,
+                            'timestamp': message.timestamp.isoformat(),
+                            'machine_id': machine.machine_id,
+                            'work_time_added': changes.work_time_added
+                        }
+                        
+                        self.logger.info(
+                            f"📊 Машина {machine.machine_id} работала {changes.work_time_added:.1f}с "
+                            f"во дворе {yard.yard_id}, убрано {yard.get_completion_percentage():.1f}%"
+                        )
             
             return status_change
             
@@ -112,7 +112,7 @@ class CleaningService:
     def _handle_yard_change(
         self, 
         machine: Machine, 
-        changes: dict, 
+        changes: PositionChange, 
         yards: Dict[int, Yard], 
         timestamp: datetime
     ) -> Optional[Dict]:
@@ -121,7 +121,7 @@ class CleaningService:
         
         Args:
             machine: Объект машины
-            changes: Словарь с изменениями
+            changes: Изменения позиции машины
             yards: Словарь дворов
             timestamp: Время изменения
             
@@ -131,9 +131,9 @@ class CleaningService:
         status_change = None
         
         # Машина покинула двор
-        if changes['left_yard'] is not None:
-            left_yard_id = changes['left_yard']
-            work_time = changes['work_time_added']
+        if changes.left_yard is not None:
+            left_yard_id = changes.left_yard
+            work_time = changes.work_time_added
             
             self.logger.info(
                 f"🚪 Машина {machine.machine_id} покинула двор {left_yard_id} "
@@ -141,8 +141,8 @@ class CleaningService:
             )
             
             # Обновляем статус покинутого двора
-            if left_yard_id in yards and work_time > 0:
-                yard = yards[left_yard_id]
+            yard = yards.get(left_yard_id)
+            if yard is not None and work_time > 0:
                 old_status = yard.status
                 new_status = yard.add_work_time(work_time)
                 
@@ -157,11 +157,11 @@ class CleaningService:
                     }
         
         # Машина вошла в новый двор
-        if changes['entered_yard'] is not None:
-            entered_yard_id = changes['entered_yard']
+        if changes.entered_yard is not None:
+            entered_yard_id = changes.entered_yard
             
-            if entered_yard_id in yards:
-                yard = yards[entered_yard_id]
+            yard = yards.get(entered_yard_id)
+            if yard is not None:
                 self.logger.info(
                     f"🏠 Машина {machine.machine_id} вошла во двор {entered_yard_id} "
                     f"(убрано {yard.get_completion_percentage():.1f}%)"
@@ -200,16 +200,20 @@ class CleaningService:
         cleaned_area = 0.0
         completion_sum = 0.0
         
+        # Один проход по дворам с чтением атрибутов напрямую,
+        # без построения словаря get_status_info()
         for yard in yards.values():
-            info = yard.get_status_info()
+            area = yard.area
+            cleaned = yard.cleaned_area
+            percentage = min(cleaned / area * 100, 100.0) if area > 0 else 0.0
             
-            total_area += info['area']
-            cleaned_area += info['cleaned_area']
-            completion_sum += info['completion_percentage']
+            total_area += area
+            cleaned_area += cleaned
+            completion_sum += percentage
             
-            if info['is_fully_cleaned']:
+            if yard.status is YardStatus.PERCENT_100:
                 cleaned_yards += 1
-            elif info['completion_percentage'] > 0:
+            elif percentage > 0:
                 partially_cleaned_yards += 1
         
         return {
@@ -245,13 +249,13 @@ class CleaningService:
         active_machines = 0
         total_work_sessions = 0
         
+        # Один проход по машинам с чтением атрибутов напрямую,
+        # без построения словаря get_current_status()
         for machine in machines.values():
-            status = machine.get_current_status()
-            
-            if status['is_active']:
+            if machine.current_yard_id is not None:
                 active_machines += 1
             
-            total_work_sessions += status['total_yards_worked']
+            total_work_sessions += len(machine.yard_work_history)
         
         return {
             'total_machines': total_machines,
@@ -291,25 +295,28 @@ class CleaningService:
         issues = []
         
         for yard in yards.values():
-            info = yard.get_status_info()
+            # Читаем атрибуты напрямую, без построения словаря get_status_info()
+            status = yard.status
+            area = yard.area
+            cleaned_area = yard.cleaned_area
             
             # Проверяем соответствие убранной площади и статуса
-            expected_status = YardStatus.get_status_by_percentage(info['completion_percentage'])
-            if info['current_status'] != expected_status:
+            expected_status = YardStatus.get_status_by_percentage(yard.get_completion_percentage())
+            if status is not expected_status:
                 issues.append(
                     f"Двор {yard.yard_id}: несоответствие статуса "
-                    f"({info['current_status'].value}% vs ожидаемый {expected_status.value}%)"
+                    f"({status.value}% vs ожидаемый {expected_status.value}%)"
                 )
             
             # Проверяем логичность убранной площади
-            if info['cleaned_area'] > info['area']:
+            if cleaned_area > area:
                 issues.append(
-                    f"Двор {yard.yard_id}: убранная площадь ({info['cleaned_area']:.1f}) "
-                    f"превышает общую площадь ({info['area']:.1f})"
+                    f"Двор {yard.yard_id}: убранная площадь ({cleaned_area:.1f}) "
+                    f"превышает общую площадь ({area:.1f})"
                 )
             
             # Проверяем отрицательные значения
-            if info['cleaned_area'] < 0 or info['total_work_time'] < 0:
+            if cleaned_area < 0 or yard.total_work_time < 0:
                 issues.append(
                     f"Двор {yard.yard_id}: отрицательные значения в данных"
                 )
@@ -3,14 +3,65 @@
 Настройка и конфигурация системы логирования для мониторинга уборочных машин
 """
 
+import atexit
+import json
 import logging
+import logging.handlers
+import os
+import queue
 import sys
+import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
+try:
+    import orjson  # Необязательная зависимость для быстрой сериализации JSON
+except ImportError:
+    orjson = None
 
-class ColoredFormatter(logging.Formatter):
+
+class CachedAsctimeFormatter(logging.Formatter):
+    """
+    Форматтер с кэшированием строки времени
+    
+    Записи, созданные в пределах одной секунды, используют одну и ту же
+    строку времени: strftime вызывается не чаще одного раза в секунду
+    """
+    
+    def __init__(self, *args, **kwargs):
+        """
+        Инициализация форматтера
+        """
+        super().__init__(*args, **kwargs)
+        self._cached_second: Optional[int] = None
+        self._cached_time = ""
+    
+    def formatTime(self, record, datefmt=None):
+        """
+        Форматирование времени записи
+        
+        Args:
+            record: Запись лога
+            datefmt: Формат даты (по умолчанию - формат logging с миллисекундами)
+            
+        Returns:
+            Строка времени
+        """
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_time = time.strftime(
+                datefmt or self.default_time_format, self.converter(second)
+            )
+            self._cached_second = second
+        
+        if datefmt:
+            return self._cached_time
+        return self.default_msec_format % (self._cached_time, record.msecs)
+
+
+class ColoredFormatter(CachedAsctimeFormatter):
     """
     Форматтер с цветным выводом для консоли
     Добавляет цвета к различным уровням логирования
@@ -26,6 +77,24 @@ class ColoredFormatter(logging.Formatter):
         'RESET': '\033[0m'        # Сброс цвета
     }
     
+    def __init__(self, *args, **kwargs):
+        """
+        Инициализация форматтера
+        
+        Цветные выровненные названия уровней строятся один раз,
+        а не при форматировании каждой записи
+        """
+        super().__init__(*args, **kwargs)
+        reset_color = self.COLORS['RESET']
+        
+        # Префиксы хранятся в кортеже с индексом по числовому уровню (0..CRITICAL):
+        # выбор префикса - обращение по индексу вместо поиска в словаре по строке
+        colored_levels: List[Optional[str]] = [None] * (logging.CRITICAL + 1)
+        for name, color in self.COLORS.items():
+            if name != 'RESET':
+                colored_levels[logging.getLevelName(name)] = f"{color}{name:8}{reset_color}"
+        self._colored_levels = tuple(colored_levels)
+    
     def format(self, record):
         """
         Форматирование записи лога с добавлением цветов
@@ -36,43 +105,257 @@ class ColoredFormatter(logging.Formatter):
         Returns:
             Отформатированная строка с цветами
         """
-        # Сохраняем оригинальное сообщение
-        original_msg = record.getMessage()
-        
-        # Добавляем цвет к уровню логирования
-        level_color = self.COLORS.get(record.levelname, '')
-        reset_color = self.COLORS['RESET']
-        
-        # Создаем цветной префикс уровня
-        colored_level = f"{level_color}{record.levelname:8}{reset_color}"
-        
-        # Заменяем уровень в записи
-        record.levelname = colored_level
+        # Заменяем уровень в записи готовым цветным префиксом
+        # (нестандартные уровни выводятся без цвета, но с тем же выравниванием)
+        levelname = record.levelname
+        levelno = record.levelno
+        colored = self._colored_levels[levelno] if 0 <= levelno <= logging.CRITICAL else None
+        if colored is None:
+            colored = f"{levelname:8}{self.COLORS['RESET']}"
+        record.levelname = colored
         
         # Форматируем запись
         formatted = super().format(record)
         
-        # Восстанавливаем оригинальные значения
-        record.levelname = record.levelname.strip()
+        # Восстанавливаем оригинальное значение
+        record.levelname = levelname
         
         return formatted
 
 
+class JsonFormatter(logging.Formatter):
+    """
+    Форматтер структурированных логов: одна JSON-строка на запись
+    
+    Кроме времени, уровня и текста сообщения добавляет в строку поля,
+    переданные через extra={'fields': {...}}, чтобы их не приходилось
+    извлекать из текста сообщения
+    """
+    
+    def format(self, record):
+        """
+        Форматирование записи лога в JSON
+        
+        Args:
+            record: Запись лога
+            
+        Returns:
+            JSON-строка без завершающего перевода строки
+        """
+        entry = {
+            'ts': record.created,
+            'lvl': record.levelname,
+            'msg': record.getMessage()
+        }
+        
+        fields = getattr(record, 'fields', None)
+        if fields:
+            entry.update(fields)
+        
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        
+        if orjson is not None:
+            return orjson.dumps(entry, default=str).decode('utf-8')
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class BatchFileHandler(logging.Handler):
+    """
+    Файловый обработчик с пакетной записью
+    
+    В отличие от logging.FileHandler не выполняет запись после каждого сообщения:
+    закодированные строки накапливаются в списке и записываются в файл одним
+    системным вызовом os.writev при накоплении buffer_size байт, сразу для
+    записей уровня flush_level и выше, при вызове flush() и при закрытии.
+    
+    Интервал flush_interval проверяется только при поступлении новой записи.
+    Чтобы накопленные строки не задерживались при отсутствии новых записей,
+    flush() должен вызываться периодически (это делает FlushingQueueListener)
+    """
+    
+    def __init__(self, filename, encoding: str = 'utf-8', 
+                 buffer_size: int = 1 << 20, flush_interval: float = 0.2,
+                 flush_level: int = logging.ERROR):
+        """
+        Инициализация обработчика
+        
+        Args:
+            filename: Путь к файлу логов (открывается на дозапись)
+            encoding: Кодировка файла
+            buffer_size: Объем накопленных данных для сброса в байтах
+            flush_interval: Интервал, после которого очередная запись
+                вызывает сброс пакета (секунды)
+            flush_level: Уровень, начиная с которого данные записываются сразу
+        """
+        super().__init__()
+        self.baseFilename = str(filename)
+        self.encoding = encoding
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        
+        self._fd: Optional[int] = os.open(
+            self.baseFilename, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+        )
+        self._buffer: List[bytes] = []
+        self._buffered_bytes = 0
+        self._last_flush = time.monotonic()
+    
+    def emit(self, record):
+        """
+        Добавление сообщения в пакет без немедленной записи на диск
+        
+        Args:
+            record: Запись лога
+        """
+        try:
+            data = (self.format(record) + '\n').encode(self.encoding)
+            self._buffer.append(data)
+            self._buffered_bytes += len(data)
+            
+            now = time.monotonic()
+            if (record.levelno >= self.flush_level or 
+                    self._buffered_bytes >= self.buffer_size or 
+                    len(self._buffer) >= _IOV_MAX or 
+                    now - self._last_flush >= self.flush_interval):
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def flush(self):
+        """
+        Запись накопленного пакета в файл
+        """
+        self.acquire()
+        try:
+            if self._buffer and self._fd is not None:
+                _write_all(self._fd, self._buffer)
+            self._buffer = []
+            self._buffered_bytes = 0
+            self._last_flush = time.monotonic()
+        finally:
+            self.release()
+    
+    def close(self):
+        """
+        Запись оставшихся данных и закрытие файла
+        """
+        self.acquire()
+        try:
+            try:
+                self.flush()
+            finally:
+                if self._fd is not None:
+                    os.close(self._fd)
+                    self._fd = None
+                super().close()
+        finally:
+            self.release()
+
+
+# Максимальное число буферов в одном вызове writev
+try:
+    _IOV_MAX = os.sysconf('SC_IOV_MAX')
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 1024
+
+
+def _write_all(fd: int, chunks: List[bytes]):
+    """
+    Запись списка буферов в файл с учетом частичной записи
+    
+    Args:
+        fd: Файловый дескриптор
+        chunks: Список записываемых буферов
+    """
+    if not hasattr(os, 'writev'):  # Например, Windows
+        data = b"".join(chunks)
+        while data:
+            data = data[os.write(fd, data):]
+        return
+    
+    while chunks:
+        written = os.writev(fd, chunks)
+        
+        # Пропускаем полностью записанные буферы и обрезаем частично записанный
+        index = 0
+        while index < len(chunks) and written >= len(chunks[index]):
+            written -= len(chunks[index])
+            index += 1
+        chunks = chunks[index:]
+        if written:
+            chunks[0] = chunks[0][written:]
+
+
+class FlushingQueueListener(logging.handlers.QueueListener):
+    """
+    Фоновый обработчик очереди логов с периодическим сбросом
+    
+    Если в течение flush_interval секунд в очередь не поступило ни одной
+    записи, вызывает flush() у всех обработчиков. Так буферизованные строки
+    попадают в файл, даже когда новых сообщений нет
+    """
+    
+    def __init__(self, queue, *handlers, respect_handler_level: bool = False,
+                 flush_interval: float = 0.2):
+        """
+        Инициализация обработчика очереди
+        
+        Args:
+            queue: Очередь записей лога
+            handlers: Обработчики, которым передаются записи
+            respect_handler_level: Учитывать уровень каждого обработчика
+            flush_interval: Время простоя очереди до сброса обработчиков (секунды)
+        """
+        super().__init__(queue, *handlers, respect_handler_level=respect_handler_level)
+        self.flush_interval = flush_interval
+    
+    def dequeue(self, block):
+        """
+        Получение записи из очереди со сбросом обработчиков при простое
+        
+        Args:
+            block: Ожидать появления записи
+            
+        Returns:
+            Очередная запись или признак окончания
+        """
+        if not block:
+            return self.queue.get(False)
+        
+        while True:
+            try:
+                return self.queue.get(True, self.flush_interval)
+            except queue.Empty:
+                for handler in self.handlers:
+                    handler.flush()
+
+
+# Шаблон сообщения об изменении статуса двора (самое частое событие)
+_STATUS_CHANGE_FORMAT = "📊 Статус двора %s изменен: %s%% → %s%% (машина %s)"
+
+
 class CleaningSystemLogger:
     """
     Специализированный логгер для системы мониторинга уборочных машин
     Предоставляет дополнительные методы для логирования специфичных событий
     """
     
-    def __init__(self, logger: logging.Logger):
+    def __init__(self, logger: logging.Logger, 
+                 listener: Optional[logging.handlers.QueueListener] = None):
         """
         Инициализация системного логгера
         
         Args:
             logger: Базовый логгер
+            listener: Фоновый обработчик очереди логов (если используется)
         """
         self.logger = logger
-        self._start_time = datetime.now()
+        self.listener = listener
+        self._start_time = time.monotonic()  # Момент создания по монотонным часам
     
     def log_machine_event(self, machine_id: int, event: str, details: str = ""):
         """
@@ -83,10 +366,11 @@ class CleaningSystemLogger:
             event: Тип события
             details: Дополнительные детали
         """
-        message = f"🚚 Машина {machine_id}: {event}"
+        fields = {'fields': {'machine_id': machine_id, 'event': event, 'details': details}}
         if details:
-            message += f" - {details}"
-        self.logger.info(message)
+            self.logger.info("🚚 Машина %s: %s - %s", machine_id, event, details, extra=fields)
+        else:
+            self.logger.info("🚚 Машина %s: %s", machine_id, event, extra=fields)
     
     def log_yard_event(self, yard_id: int, event: str, details: str = ""):
         """
@@ -97,10 +381,11 @@ class CleaningSystemLogger:
             event: Тип события
             details: Дополнительные детали
         """
-        message = f"🏠 Двор {yard_id}: {event}"
+        fields = {'fields': {'yard_id': yard_id, 'event': event, 'details': details}}
         if details:
-            message += f" - {details}"
-        self.logger.info(message)
+            self.logger.info("🏠 Двор %s: %s - %s", yard_id, event, details, extra=fields)
+        else:
+            self.logger.info("🏠 Двор %s: %s", yard_id, event, extra=fields)
     
     def log_status_change(self, yard_id: int, old_status: int, new_status: int, machine_id: int):
         """
@@ -112,9 +397,19 @@ class CleaningSystemLogger:
             new_status: Новый статус
             machine_id: ID машины, вызвавшей изменение
         """
+        # Поля для структурированного лога собираются только если запись будет выведена
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         self.logger.info(
-            f"📊 Статус двора {yard_id} изменен: {old_status}% → {new_status}% "
-            f"(машина {machine_id})"
+            _STATUS_CHANGE_FORMAT,
+            yard_id, old_status, new_status, machine_id,
+            extra={'fields': {
+                'yard_id': yard_id,
+                'old_status': old_status,
+                'new_status': new_status,
+                'machine_id': machine_id
+            }}
         )
     
     def log_system_stats(self, stats: dict):
@@ -124,12 +419,16 @@ class CleaningSystemLogger:
         Args:
             stats: Словарь со статистикой
         """
-        self.logger.info("📈 Системная статистика:")
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
+        # Вся статистика выводится одной многострочной записью
+        parts = ["📈 Системная статистика:"]
+        append = parts.append
         for key, value in stats.items():
-            if isinstance(value, float):
-                self.logger.info(f"   {key}: {value:.2f}")
-            else:
-                self.logger.info(f"   {key}: {value}")
+            append(f"   {key}: {value:.2f}" if isinstance(value, float) else f"   {key}: {value}")
+        
+        self.logger.info("\n".join(parts))
     
     def log_performance_metrics(self, messages_processed: int, processing_time: float):
         """
@@ -139,11 +438,14 @@ class CleaningSystemLogger:
             messages_processed: Количество обработанных сообщений
             processing_time: Время обработки в секундах
         """
-        rate = messages_processed / processing_time if processing_time > 0 else 0
-        self.logger.info(
-            f"⚡ Производительность: {messages_processed} сообщений за {processing_time:.2f}с "
-            f"({rate:.1f} сообщ/сек)"
-        )
+        # Без измеримого времени обработки скорость не рассчитывается
+        if processing_time > 0:
+            self.logger.info(
+                "⚡ Производительность: %s сообщений за %.2fс (%.1f сообщ/сек)",
+                messages_processed, processing_time, messages_processed / processing_time
+            )
+        else:
+            self.logger.info("⚡ Производительность: %s сообщений (время обработки 0)", messages_processed)
     
     def log_error_with_context(self, error: Exception, context: str):
         """
@@ -153,7 +455,7 @@ class CleaningSystemLogger:
             error: Исключение
             context: Контекст возникновения ошибки
         """
-        self.logger.error(f"❌ Ошибка в {context}: {type(error).__name__}: {error}")
+        self.logger.error("❌ Ошибка в %s: %s: %s", context, type(error).__name__, error)
     
     def get_uptime(self) -> str:
         """
@@ -162,21 +464,94 @@ class CleaningSystemLogger:
         Returns:
             Строка с временем работы
         """
-        uptime = datetime.now() - self._start_time
-        return str(uptime).split('.')[0]  # Убираем микросекунды
+        # Целые секунды без микросекунд, формат Ч:ММ:СС
+        seconds = int(time.monotonic() - self._start_time)
+        hours, remainder = divmod(seconds, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    
+    def close(self):
+        """
+        Остановка фонового обработчика логов
+        
+        Дожидается записи всех сообщений, накопленных в очереди, и снимает
+        с логгера QueueHandler: записи, отправленные после остановки,
+        остались бы в очереди и не были бы выведены
+        """
+        # Обработчик мог быть уже остановлен повторной настройкой логирования
+        if self.listener is not None and self.listener is _active_listener:
+            for handler in list(self.logger.handlers):
+                if isinstance(handler, logging.handlers.QueueHandler):
+                    self.logger.removeHandler(handler)
+            _stop_active_listener()
+        self.listener = None
+
+
+# Фоновый обработчик очереди логов, запущенный последним вызовом setup_logging
+_active_listener: Optional[logging.handlers.QueueListener] = None
+_atexit_registered = False
+
+# Параметры и результат последней настройки логирования (для повторных вызовов)
+_active_config: Optional[tuple] = None
+_active_system_logger: Optional['CleaningSystemLogger'] = None
+
+
+def _stop_active_listener():
+    """
+    Остановка активного обработчика очереди логов и закрытие его обработчиков
+    """
+    global _active_listener
+    
+    if _active_listener is None:
+        return
+    
+    listener = _active_listener
+    _active_listener = None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
 
 
-def setup_logging(debug_mode: bool = False, log_file: Optional[str] = None) -> CleaningSystemLogger:
+@lru_cache(maxsize=None)
+def _ensure_dir(path: str) -> Path:
+    """
+    Создание директории (однократно для каждого пути за время работы процесса)
+    
+    Args:
+        path: Путь к директории
+        
+    Returns:
+        Объект пути к директории
+    """
+    directory = Path(path)
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+
+def setup_logging(debug_mode: bool = False, log_file: Optional[str] = None, 
+                  console: bool = True, json_format: bool = False) -> CleaningSystemLogger:
     """
     Настройка системы логирования
     
     Args:
         debug_mode: Включить режим отладки
         log_file: Путь к файлу логов (опционально)
+        console: Выводить сообщения в консоль (без консоли - только в файл)
+        json_format: Писать файл логов в виде JSON-строк (структурированные логи)
         
     Returns:
         Настроенный логгер системы
     """
+    global _active_listener, _atexit_registered, _active_config, _active_system_logger
+    
+    # Повторный вызов с теми же параметрами возвращает уже настроенный логгер,
+    # не пересоздавая обработчики и не открывая файл заново
+    config = (debug_mode, str(log_file) if log_file else None, console, json_format)
+    if (config == _active_config and _active_system_logger is not None and 
+            _active_system_logger.listener is not None and 
+            _active_system_logger.listener is _active_listener):
+        return _active_system_logger
+    
     # Определяем уровень логирования
     log_level = logging.DEBUG if debug_mode else logging.INFO
     
@@ -184,43 +559,74 @@ def setup_logging(debug_mode: bool = False, log_file: Optional[str] = None) -> C
     logger = logging.getLogger('cleaning_system')
     logger.setLevel(log_level)
     
-    # Очищаем существующие обработчики
+    # Очищаем существующие обработчики и останавливаем предыдущую очередь логов
     logger.handlers.clear()
+    _stop_active_listener()
     
     # Создаем директорию для логов
     if log_file:
-        log_path = Path(log_file)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
+        log_file = str(log_file)
+        _ensure_dir(os.path.dirname(log_file) or '.')
     else:
-        log_dir = Path('logs')
-        log_dir.mkdir(exist_ok=True)
-        log_file = log_dir / f"cleaning_system_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+        _ensure_dir('logs')
+        log_file = os.path.join('logs', f"cleaning_system_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
+    
+    # Не собираем сведения о потоках и процессах: они не используются в форматах
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
     
     # Форматы сообщений
     console_format = '%(asctime)s | %(levelname)s | %(message)s'
+    console_date_format = '%H:%M:%S'  # Короткое время без даты и миллисекунд
     file_format = '%(asctime)s | %(levelname)-8s | %(name)s | %(funcName)s:%(lineno)d | %(message)s'
     
-    # Настройка консольного вывода
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(log_level)
-    
-    if sys.stdout.isatty():  # Если вывод в терминал, используем цвета
-        console_formatter = ColoredFormatter(console_format)
-    else:  # Если вывод перенаправлен, не используем цвета
-        console_formatter = logging.Formatter(console_format)
+    handlers = []
     
-    console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+    # Настройка консольного вывода
+    if console:
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(log_level)
+        
+        # Цвета используются только для терминала и если они не отключены через NO_COLOR
+        if sys.stdout.isatty() and not os.environ.get('NO_COLOR'):
+            console_formatter = ColoredFormatter(console_format, console_date_format)
+        else:
+            console_formatter = CachedAsctimeFormatter(console_format, console_date_format)
+        
+        console_handler.setFormatter(console_formatter)
+        handlers.append(console_handler)
     
     # Настройка файлового вывода
-    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    # (пакетная запись вместо системного вызова на каждое сообщение)
+    file_handler = BatchFileHandler(log_file, encoding='utf-8')
     file_handler.setLevel(logging.DEBUG)  # В файл записываем все
-    file_formatter = logging.Formatter(file_format)
+    file_formatter = JsonFormatter() if json_format else CachedAsctimeFormatter(file_format)
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+    handlers.append(file_handler)
+    
+    # Вызывающий поток только помещает запись в очередь, а вывод в консоль
+    # и запись в файл выполняются фоновым потоком QueueListener
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    # Фоновый поток сбрасывает пакет файлового вывода при простое очереди
+    listener = FlushingQueueListener(
+        log_queue, *handlers, respect_handler_level=True,
+        flush_interval=file_handler.flush_interval
+    )
+    listener.start()
+    _active_listener = listener
+    
+    # При завершении программы дописываем оставшиеся в очереди сообщения
+    if not _atexit_registered:
+        atexit.register(_stop_active_listener)
+        _atexit_registered = True
     
     # Создаем специализированный логгер
-    system_logger = CleaningSystemLogger(logger)
+    system_logger = CleaningSystemLogger(logger, listener)
+    _active_config = config
+    _active_system_logger = system_logger
     
     # Логируем инициализацию
     logger.info(" Система логирования инициализирована")
@@ -246,7 +652,7 @@ def create_file_logger(name: str, log_file: str, level: int = logging.INFO) -> l
     logger.setLevel(level)
     
     # Создаем директорию если нужно
-    Path(log_file).parent.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(os.path.dirname(log_file) or '.')
     
     # Настраиваем обработчик
     handler = logging.FileHandler(log_file, encoding='utf-8')
@@ -261,21 +667,43 @@ def create_file_logger(name: str, log_file: str, level: int = logging.INFO) -> l
     return logger
 
 
+@lru_cache(maxsize=1)
+def _get_system_info() -> tuple:
+    """
+    Получение сведений о системе (собираются один раз за время работы процесса)
+    
+    Returns:
+        Кортеж (платформа, версия Python, процессор, ОЗУ в ГБ, диск в ГБ)
+    """
+    import platform
+    import psutil
+    
+    return (
+        platform.platform(),
+        platform.python_version(),
+        platform.processor(),
+        psutil.virtual_memory().total // (1024**3),
+        psutil.disk_usage('/').total // (1024**3)
+    )
+
+
 def log_system_info():
     """
     Логирование информации о системе
     """
     logger = logging.getLogger('cleaning_system')
     
-    import platform
-    import psutil
+    platform_name, python_version, processor, memory_gb, disk_gb = _get_system_info()
     
-    logger.info("💻 Информация о системе:")
-    logger.info(f"   Платформа: {platform.platform()}")
-    logger.info(f"   Python: {platform.python_version()}")
-    logger.info(f"   Процессор: {platform.processor()}")
-    logger.info(f"   ОЗУ: {psutil.virtual_memory().total // (1024**3)} ГБ")
-    logger.info(f"   Диск: {psutil.disk_usage('/').total // (1024**3)} ГБ")
+    logger.info(
+        "💻 Информация о системе:\n"
+        "   Платформа: %s\n"
+        "   Python: %s\n"
+        "   Процессор: %s\n"
+        "   ОЗУ: %s ГБ\n"
+        "   Диск: %s ГБ",
+        platform_name, python_version, processor, memory_gb, disk_gb
+    )
 
 
 def setup_debug_logging() -> CleaningSystemLogger:
@@ -288,15 +716,16 @@ def setup_debug_logging() -> CleaningSystemLogger:
     return setup_logging(debug_mode=True)
 
 
-def setup_production_logging(log_dir: str = "logs") -> CleaningSystemLogger:
+def setup_production_logging(log_dir: str = "logs", console: bool = False) -> CleaningSystemLogger:
     """
     Настройка логирования для продакшена
     
     Args:
         log_dir: Директория для логов
+        console: Дублировать сообщения в консоль (по умолчанию только файл)
         
     Returns:
         Логгер для продакшена
     """
-    log_file = Path(log_dir) / f"production_{datetime.now().strftime('%Y%m%d')}.log"
-    return setup_logging(debug_mode=False, log_file=str(log_file))
\ No newline at end of file
+    log_file = os.path.join(log_dir, f"production_{datetime.now().strftime('%Y%m%d')}.log")
+    return setup_logging(debug_mode=False, log_file=log_file, console=console)
\ No newline at end of file
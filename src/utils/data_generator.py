@@ -5,9 +5,31 @@
 
 import json
 import random
+from collections import Counter
 from datetime import datetime, timedelta
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Any
+
+try:
+    import orjson  # Необязательная зависимость для быстрой записи JSON
+except ImportError:
+    orjson = None
+
+
+def _dumps_json(data: Any) -> bytes:
+    """
+    Сериализация данных в JSON с отступом в 2 пробела
+    
+    Args:
+        data: Сериализуемые данные
+        
+    Returns:
+        JSON-документ в кодировке UTF-8
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
 
 
 class TestDataGenerator:
@@ -33,6 +55,23 @@ class TestDataGenerator:
         self.machines: List[int] = []
         self.messages: List[Dict] = []
         
+        # Кэш детерминированных позиций: базовые координаты дворов,
+        # смещения машин внутри дворов и позиции машин вне дворов
+        self._yard_positions: Dict[int, Tuple[float, float]] = {}
+        self._yard_machine_offsets: Dict[Tuple[int, int], Tuple[float, float]] = {}
+        self._machine_positions: Dict[int, Tuple[float, float]] = {}
+        
+        # ID всех дворов и дворы, выбранные для уборки (выбираются один раз
+        # при генерации сообщений)
+        self._yard_ids: List[int] = []
+        self._yards_to_clean: List[int] = []
+        
+        # Статистика по сообщениям (подсчитывается за один проход после генерации)
+        self._messages_per_machine: Counter = Counter()
+        self._messages_in_yards = 0
+        self._yards_mentioned: set = set()
+        self._average_interval = 0.0
+        
         # Конфигурация генерации
         self.config = {
             'min_yards': 10,
@@ -78,6 +117,9 @@ class TestDataGenerator:
             self._generate_realistic_messages()
             print(f" Сгенерировано {len(self.messages)} сообщений")
             
+            # Один проход по сообщениям для статистики и проверки требований
+            self._collect_message_statistics()
+            
             # Сохраняем данные
             self._save_yards(output_path / "yards.txt")
             self._save_messages(output_path / "machine_messages.json")
@@ -95,8 +137,9 @@ class TestDataGenerator:
     def _generate_yards(self):
         """Генерация дворов"""
         num_yards = random.randint(self.config['min_yards'], self.config['max_yards'])
+        self._yard_ids = list(range(1, num_yards + 1))
         
-        for yard_id in range(1, num_yards + 1):
+        for yard_id in self._yard_ids:
             area = random.uniform(*self.config['yard_area_range'])
             cleaning_speed = random.uniform(*self.config['cleaning_speed_range'])
             
@@ -109,6 +152,9 @@ class TestDataGenerator:
                 'area': area,
                 'cleaning_speed': cleaning_speed
             })
+            
+            # Сразу вычисляем фиксированную позицию двора
+            self._get_yard_position(yard_id)
     
     def _generate_machines(self):
         """Генерация списка машин"""
@@ -120,62 +166,83 @@ class TestDataGenerator:
         Генерация сообщений с реалистичными временными интервалами
         """
         # Определяем дворы, которые будут убираться (80% от общего количества)
-        yards_to_clean = self._select_yards_for_cleaning()
+        yards_to_clean = self._yards_to_clean = self._select_yards_for_cleaning()
         
         # Начальное время - текущее время минус длительность симуляции
         start_time = datetime.now() - timedelta(minutes=self.config['simulation_duration_minutes'])
         
         # Сначала генерируем сообщения для каждой машины (минимум 5)
         all_messages = []
+        append_message = all_messages.append
+        
+        # Параметры и методы, используемые на каждой итерации, связываем заранее
+        in_yard_probability = self.config['message_in_yard_percent'] / 100
+        get_yard_position = self._get_yard_position_with_variance
+        get_outside_position = self._random_position_with_machine_variance
+        get_interval = self._get_realistic_interval
         
         for machine_id in self.machines:
             # Генерируем минимум сообщений для этой машины
             messages_for_machine = random.randint(*self.config['messages_per_machine'])
-            machine_messages = []
             
             current_time = start_time + timedelta(minutes=random.uniform(0, 5))  # Небольшой сдвиг для каждой машины
             
+            # Позиции машины фиксированы, поэтому округляем их один раз,
+            # а не для каждого сообщения
+            outside_x, outside_y = get_outside_position(machine_id)
+            outside_position = (round(outside_x, 2), round(outside_y, 2))
+            yard_positions = {}
+            
             for msg_idx in range(messages_for_machine):
                 # Определяем, должно ли сообщение быть во дворе (80% вероятность)
-                should_be_in_yard = random.random() < (self.config['message_in_yard_percent'] / 100)
+                should_be_in_yard = random.random() < in_yard_probability
                 
                 if should_be_in_yard and yards_to_clean:
                     # Сообщение во дворе
                     yard_id = random.choice(yards_to_clean)
-                    position = self._get_yard_position_with_variance(yard_id, machine_id)
+                    position = yard_positions.get(yard_id)
+                    if position is None:
+                        x, y = get_yard_position(yard_id, machine_id)
+                        position = yard_positions[yard_id] = (round(x, 2), round(y, 2))
                 else:
                     # Сообщение вне дворов
                     yard_id = None
-                    position = self._random_position_with_machine_variance(machine_id)
+                    position = outside_position
                 
-                # Создаем сообщение
-                message = {
+                # Создаем сообщение (время хранится как datetime и переводится
+                # в строку только при сохранении)
+                append_message({
                     'machine_id': machine_id,
-                    'timestamp': current_time.isoformat(),
-                    'x': round(position[0], 2),
-                    'y': round(position[1], 2),
+                    'timestamp': current_time,
+                    'x': position[0],
+                    'y': position[1],
                     'yard_id': yard_id
-                }
-                
-                machine_messages.append(message)
+                })
                 
                 # Добавляем реалистичный интервал (небольшие вариации для каждой машины)
-                interval = self._get_realistic_interval() + random.uniform(-0.2, 0.2)
+                interval = get_interval() + random.uniform(-0.2, 0.2)
                 current_time += timedelta(seconds=max(0.5, interval))
-            
-            all_messages.extend(machine_messages)
         
         # Сортируем все сообщения по времени
-        all_messages.sort(key=lambda x: x['timestamp'])
+        all_messages.sort(key=itemgetter('timestamp'))
         
         # Корректируем временные метки для реалистичных интервалов
         self.messages = self._normalize_message_intervals(all_messages)
         
-        # Проверяем и исправляем покрытие дворов
-        self._validate_and_fix_yard_coverage()
+        # Статистика для обеих проверок собирается за один проход
+        yards_mentioned = set()
+        messages_in_yards = 0
+        for msg in self.messages:
+            yard_id = msg['yard_id']
+            if yard_id is not None:
+                yards_mentioned.add(yard_id)
+                messages_in_yards += 1
+        
+        # Проверяем и исправляем покрытие дворов (все добавленные сообщения - во дворах)
+        messages_in_yards += self._validate_and_fix_yard_coverage(yards_mentioned)
         
         # Проверяем и исправляем распределение сообщений по дворам
-        self._validate_and_fix_message_distribution()
+        self._validate_and_fix_message_distribution(messages_in_yards)
         
         # Добавляем небольшую потерю сообщений на уровне генерации
         self._add_generation_losses()
@@ -183,28 +250,27 @@ class TestDataGenerator:
     def _normalize_message_intervals(self, messages: List[Dict]) -> List[Dict]:
         """
         Нормализация интервалов между сообщениями для достижения ~1 секунды
+        
+        Временные метки заменяются на месте: список сообщений создается
+        генератором, поэтому копировать каждое сообщение не требуется
         """
-        if len(messages) <= 1:
+        if not messages:
             return messages
         
-        # Создаем новый список с нормализованными временными метками
-        normalized_messages = []
-        start_time = datetime.fromisoformat(messages[0]['timestamp'])
-        
-        for i, message in enumerate(messages):
-            if i == 0:
-                # Первое сообщение остается как есть
-                normalized_messages.append(message.copy())
-            else:
-                # Вычисляем новое время с правильным интервалом
-                interval = self._get_realistic_interval()
-                new_time = start_time + timedelta(seconds=i * interval)
-                
-                new_message = message.copy()
-                new_message['timestamp'] = new_time.isoformat()
-                normalized_messages.append(new_message)
+        # Время может быть передано как datetime или как ISO-строка
+        start_time = messages[0]['timestamp']
+        if isinstance(start_time, str):
+            start_time = datetime.fromisoformat(start_time)
+        
+        # Первое сообщение сохраняет свое время
+        messages[0]['timestamp'] = start_time
+        get_interval = self._get_realistic_interval
+        
+        for i in range(1, len(messages)):
+            # Вычисляем новое время с правильным интервалом
+            messages[i]['timestamp'] = start_time + timedelta(seconds=i * get_interval())
         
-        return normalized_messages
+        return messages
     
     def _get_realistic_interval(self) -> float:
         """
@@ -223,46 +289,48 @@ class TestDataGenerator:
         """
         Получение позиции во дворе с вариациями для разных машин
         """
-        base_position = self._get_yard_position(yard_id)
-        
-        # Добавляем уникальные вариации для каждой машины
-        machine_seed = hash((yard_id, machine_id)) % 10000
-        random.seed(machine_seed)
-        
-        # Небольшие вариации в пределах двора
-        x_offset = random.uniform(-8, 8)
-        y_offset = random.uniform(-8, 8)
-        
-        # Восстанавливаем общий сид
-        random.seed(42)
+        base_x, base_y = self._get_yard_position(yard_id)
+        
+        # Уникальные вариации для каждой пары двор-машина вычисляются один раз
+        # отдельным генератором, не затрагивая общую последовательность случайных чисел
+        key = (yard_id, machine_id)
+        offset = self._yard_machine_offsets.get(key)
+        if offset is None:
+            machine_random = random.Random(hash(key) % 10000)
+            
+            # Небольшие вариации в пределах двора
+            offset = (machine_random.uniform(-8, 8), machine_random.uniform(-8, 8))
+            self._yard_machine_offsets[key] = offset
         
-        return (base_position[0] + x_offset, base_position[1] + y_offset)
+        return (base_x + offset[0], base_y + offset[1])
     
     def _random_position_with_machine_variance(self, machine_id: int) -> Tuple[float, float]:
         """
         Генерация случайной позиции с учетом машины
         """
-        # Создаем уникальную позицию для каждой машины
-        machine_seed = hash(machine_id) % 10000
-        random.seed(machine_seed)
-        
-        x = random.uniform(*self.config['coordinate_range'])
-        y = random.uniform(*self.config['coordinate_range'])
-        
-        # Добавляем небольшую случайность
-        x += random.uniform(-15, 15)
-        y += random.uniform(-15, 15)
-        
-        # Восстанавливаем общий сид
-        random.seed(42)
+        # Уникальная позиция для каждой машины вычисляется один раз
+        position = self._machine_positions.get(machine_id)
+        if position is None:
+            machine_random = random.Random(hash(machine_id) % 10000)
+            
+            x = machine_random.uniform(*self.config['coordinate_range'])
+            y = machine_random.uniform(*self.config['coordinate_range'])
+            
+            # Добавляем небольшую случайность
+            x += machine_random.uniform(-15, 15)
+            y += machine_random.uniform(-15, 15)
+            
+            position = self._machine_positions[machine_id] = (x, y)
         
-        return (x, y)
+        return position
     
-    def _validate_and_fix_message_distribution(self):
+    def _validate_and_fix_message_distribution(self, messages_in_yards: int):
         """
         Проверка и исправление распределения сообщений (80% во дворах)
+        
+        Args:
+            messages_in_yards: Текущее количество сообщений во дворах
         """
-        messages_in_yards = sum(1 for msg in self.messages if msg['yard_id'] is not None)
         current_percentage = (messages_in_yards / len(self.messages) * 100) if self.messages else 0
         
         target_percentage = self.config['message_in_yard_percent']
@@ -281,7 +349,7 @@ class TestDataGenerator:
                 
                 # Выбираем случайные сообщения для перемещения
                 indices_to_move = random.sample(messages_outside, messages_to_move)
-                yards_to_clean = self._select_yards_for_cleaning()
+                yards_to_clean = self._yards_to_clean
                 
                 for idx in indices_to_move:
                     # Перемещаем сообщение во двор
@@ -305,22 +373,26 @@ class TestDataGenerator:
         total_yards = len(self.yards)
         num_to_clean = max(1, int(total_yards * self.config['yard_coverage_percent'] / 100))
         
-        yard_ids = [yard['yard_id'] for yard in self.yards]
-        return random.sample(yard_ids, num_to_clean)
+        return random.sample(self._yard_ids, num_to_clean)
     
-    def _validate_and_fix_yard_coverage(self):
+    def _validate_and_fix_yard_coverage(self, yards_mentioned: set) -> int:
         """
         Проверка и исправление покрытия дворов до достижения 80%
+        
+        Args:
+            yards_mentioned: Множество ID дворов, упомянутых в сообщениях
+            
+        Returns:
+            Количество добавленных сообщений
         """
-        yards_mentioned = set(msg['yard_id'] for msg in self.messages if msg['yard_id'] is not None)
+        original_count = len(self.messages)
         current_coverage = len(yards_mentioned) / len(self.yards) * 100 if self.yards else 0
         
         if current_coverage < 80:
             print(f" Покрытие дворов {current_coverage:.1f}% < 80%, добавляем сообщения...")
             
             # Находим дворы, которые не посещались
-            all_yard_ids = [yard['yard_id'] for yard in self.yards]
-            unvisited_yards = [y_id for y_id in all_yard_ids if y_id not in yards_mentioned]
+            unvisited_yards = [y_id for y_id in self._yard_ids if y_id not in yards_mentioned]
             
             # Сколько дворов нужно добавить для достижения 80%
             target_yards_count = int(len(self.yards) * 0.8)
@@ -346,7 +418,7 @@ class TestDataGenerator:
                         # Выбираем случайное время из существующих сообщений
                         if self.messages:
                             random_msg = random.choice(self.messages)
-                            base_time = datetime.fromisoformat(random_msg['timestamp'])
+                            base_time = random_msg['timestamp']
                             # Добавляем небольшое смещение
                             time_offset = random.uniform(-300, 300)  # ±5 минут
                             new_time = base_time + timedelta(seconds=time_offset)
@@ -357,16 +429,19 @@ class TestDataGenerator:
                         
                         message = {
                             'machine_id': machine_id,
-                            'timestamp': new_time.isoformat(),
+                            'timestamp': new_time,
                             'x': round(yard_position[0], 2),
                             'y': round(yard_position[1], 2),
                             'yard_id': yard_id
                         }
                         self.messages.append(message)
                 
-                # Пересортируем сообщения по времени
-                self.messages.sort(key=lambda x: x['timestamp'])
+                # Пересортируем сообщения по времени (основная часть списка уже
+                # упорядочена, и сортировка сливает с ней только добавленный хвост)
+                self.messages.sort(key=itemgetter('timestamp'))
                 print(f" Добавлено сообщений для {len(yards_to_visit)} дворов")
+        
+        return len(self.messages) - original_count
     
     def _random_position(self) -> Tuple[float, float]:
         """Генерация случайной позиции"""
@@ -384,16 +459,16 @@ class TestDataGenerator:
         Returns:
             Координаты двора
         """
-        # Генерируем фиксированные координаты для каждого двора
-        # Используем yard_id как сид для воспроизводимости
-        random.seed(yard_id * 1000)
-        x = random.uniform(*self.config['coordinate_range'])
-        y = random.uniform(*self.config['coordinate_range'])
-        
-        # Восстанавливаем общий сид
-        random.seed(42)
-        
-        return (x, y)
+        position = self._yard_positions.get(yard_id)
+        if position is None:
+            # Генерируем фиксированные координаты для каждого двора
+            # Используем yard_id как сид отдельного генератора для воспроизводимости
+            yard_random = random.Random(yard_id * 1000)
+            x = yard_random.uniform(*self.config['coordinate_range'])
+            y = yard_random.uniform(*self.config['coordinate_range'])
+            position = self._yard_positions[yard_id] = (x, y)
+        
+        return position
     
     def _add_generation_losses(self):
         """Симуляция потерь сообщений на уровне генерации (дополнительно к потерям при передаче)"""
@@ -402,56 +477,93 @@ class TestDataGenerator:
         num_to_remove = int(len(self.messages) * loss_rate)
         
         if num_to_remove > 0:
-            indices_to_remove = random.sample(range(len(self.messages)), num_to_remove)
-            # Удаляем в обратном порядке, чтобы не нарушить индексы
-            for index in sorted(indices_to_remove, reverse=True):
-                del self.messages[index]
+            indices_to_remove = set(random.sample(range(len(self.messages)), num_to_remove))
+            # Собираем оставшиеся сообщения за один проход вместо удаления по одному
+            self.messages = [
+                msg for index, msg in enumerate(self.messages) if index not in indices_to_remove
+            ]
+    
+    def _collect_message_statistics(self):
+        """
+        Подсчет статистики по сообщениям за один проход
+        
+        Заполняет количество сообщений по машинам, количество сообщений
+        во дворах, множество упомянутых дворов и средний интервал, которые
+        используются и при сохранении метаданных, и при выводе статистики
+        """
+        messages_per_machine = Counter()
+        yards_mentioned = set()
+        messages_in_yards = 0
+        
+        for msg in self.messages:
+            messages_per_machine[msg['machine_id']] += 1
+            yard_id = msg['yard_id']
+            if yard_id is not None:
+                yards_mentioned.add(yard_id)
+                messages_in_yards += 1
+        
+        self._messages_per_machine = messages_per_machine
+        self._messages_in_yards = messages_in_yards
+        self._yards_mentioned = yards_mentioned
+        self._average_interval = self._get_average_interval()
     
     def _save_yards(self, file_path: Path):
         """Сохранение справочника дворов"""
+        lines = ["# Справочник дворов", "# Формат: yard_id,area,cleaning_speed"]
+        lines.extend(
+            f"{yard['yard_id']},{yard['area']},{yard['cleaning_speed']}" for yard in self.yards
+        )
+        lines.append("")
+        
+        # Весь справочник записывается одним вызовом
         with open(file_path, 'w', encoding='utf-8') as f:
-            f.write("# Справочник дворов\n")
-            f.write("# Формат: yard_id,area,cleaning_speed\n")
-            
-            for yard in self.yards:
-                f.write(f"{yard['yard_id']},{yard['area']},{yard['cleaning_speed']}\n")
+            f.write("\n".join(lines))
     
     def _save_messages(self, file_path: Path):
-        """Сохранение сообщений от машин"""
-        data = {
-            'metadata': {
-                'total_messages': len(self.messages),
-                'machines_count': len(self.machines),
-                'generation_time': datetime.now().isoformat(),
-                'simulation_duration_minutes': self.config['simulation_duration_minutes'],
-                'base_message_interval_seconds': self.config['base_message_interval'],
-                'timing_mode': 'realistic_intervals'
-            },
-            'messages': self.messages
+        """
+        Сохранение сообщений от машин
+        
+        Сообщения сериализуются и записываются по одному, поэтому в памяти
+        не собирается JSON-документ целиком. Результат совпадает с выводом
+        json.dump(data, indent=2)
+        """
+        metadata = {
+            'total_messages': len(self.messages),
+            'machines_count': len(self.machines),
+            'generation_time': datetime.now().isoformat(),
+            'simulation_duration_minutes': self.config['simulation_duration_minutes'],
+            'base_message_interval_seconds': self.config['base_message_interval'],
+            'timing_mode': 'realistic_intervals'
         }
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        # Вложенные документы сдвигаются на свой уровень вложенности
+        # (переводы строк внутри JSON-строк экранированы, поэтому замена безопасна)
+        with open(file_path, 'wb') as f:
+            f.write(b'{\n  "metadata": ')
+            f.write(_dumps_json(metadata).replace(b'\n', b'\n  '))
+            f.write(b',\n  "messages": [')
+            
+            separator = b'\n    '
+            for msg in self.messages:
+                # Время переводится в ISO-строку только здесь, при записи
+                msg = {**msg, 'timestamp': msg['timestamp'].isoformat()}
+                f.write(separator)
+                f.write(_dumps_json(msg).replace(b'\n', b'\n    '))
+                separator = b',\n    '
+            
+            f.write(b'\n  ]\n}' if self.messages else b']\n}')
     
     def _save_metadata(self, file_path: Path):
         """Сохранение метаданных генерации"""
         # Анализ временных интервалов
-        intervals = []
-        if len(self.messages) > 1:
-            for i in range(1, len(self.messages)):
-                prev_time = datetime.fromisoformat(self.messages[i-1]['timestamp'])
-                curr_time = datetime.fromisoformat(self.messages[i]['timestamp'])
-                interval = (curr_time - prev_time).total_seconds()
-                intervals.append(interval)
-        
-        avg_interval = sum(intervals) / len(intervals) if intervals else 0
+        intervals_count = max(len(self.messages) - 1, 0)
+        avg_interval = self._average_interval
         
         # Статистика по сообщениям во дворах
-        messages_in_yards = sum(1 for msg in self.messages if msg['yard_id'] is not None)
-        yard_coverage_actual = messages_in_yards / len(self.messages) * 100 if self.messages else 0
+        yard_coverage_actual = self._messages_in_yards / len(self.messages) * 100 if self.messages else 0
         
         # Статистика по убираемым дворам
-        yards_mentioned = set(msg['yard_id'] for msg in self.messages if msg['yard_id'] is not None)
+        yards_mentioned = self._yards_mentioned
         yard_usage_actual = len(yards_mentioned) / len(self.yards) * 100 if self.yards else 0
         
         metadata = {
@@ -465,7 +577,7 @@ class TestDataGenerator:
             'timing_analysis': {
                 'target_interval_seconds': self.config['base_message_interval'],
                 'actual_average_interval_seconds': round(avg_interval, 2),
-                'total_intervals_analyzed': len(intervals),
+                'total_intervals_analyzed': intervals_count,
                 'realistic_timing_achieved': 0.7 <= avg_interval <= 1.5
             },
             'statistics': {
@@ -478,8 +590,7 @@ class TestDataGenerator:
                 'min_10_yards': len(self.yards) >= 10,
                 'min_5_machines': len(self.machines) >= 5,
                 'min_5_messages_per_machine': all(
-                    sum(1 for msg in self.messages if msg['machine_id'] == m_id) >= 5 
-                    for m_id in self.machines
+                    self._messages_per_machine[m_id] >= 5 for m_id in self.machines
                 ),
                 '80_percent_yards_cleaned': yard_usage_actual >= 80,
                 '80_percent_messages_in_yards': yard_coverage_actual >= 80,
@@ -487,8 +598,25 @@ class TestDataGenerator:
             }
         }
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, ensure_ascii=False, indent=2)
+        with open(file_path, 'wb') as f:
+            f.write(_dumps_json(metadata))
+    
+    def _get_average_interval(self) -> float:
+        """
+        Расчет среднего интервала между соседними сообщениями
+        
+        Сумма интервалов между соседними сообщениями равна разности времени
+        последнего и первого сообщения, поэтому достаточно двух меток
+        
+        Returns:
+            Средний интервал в секундах (0 если сообщений меньше двух)
+        """
+        if len(self.messages) < 2:
+            return 0
+        
+        first_time = self.messages[0]['timestamp']
+        last_time = self.messages[-1]['timestamp']
+        return (last_time - first_time).total_seconds() / (len(self.messages) - 1)
     
     def _print_statistics(self):
         """Вывод статистики генерации"""
@@ -499,31 +627,21 @@ class TestDataGenerator:
         
         # Анализ временных интервалов
         if len(self.messages) > 1:
-            intervals = []
-            for i in range(1, len(self.messages)):
-                prev_time = datetime.fromisoformat(self.messages[i-1]['timestamp'])
-                curr_time = datetime.fromisoformat(self.messages[i]['timestamp'])
-                interval = (curr_time - prev_time).total_seconds()
-                intervals.append(interval)
-            
-            avg_interval = sum(intervals) / len(intervals)
+            avg_interval = self._average_interval
             print(f"   Средний интервал: {avg_interval:.2f}с (цель: {self.config['base_message_interval']}с)")
         
         # Проверяем требования
-        messages_in_yards = sum(1 for msg in self.messages if msg['yard_id'] is not None)
+        messages_in_yards = self._messages_in_yards
         yard_coverage = messages_in_yards / len(self.messages) * 100 if self.messages else 0
         
-        yards_mentioned = set(msg['yard_id'] for msg in self.messages if msg['yard_id'] is not None)
+        yards_mentioned = self._yards_mentioned
         yard_usage = len(yards_mentioned) / len(self.yards) * 100 if self.yards else 0
         
         print(f"   Сообщений во дворах: {messages_in_yards} ({yard_coverage:.1f}%)")
         print(f"   Дворов использовано: {len(yards_mentioned)} из {len(self.yards)} ({yard_usage:.1f}%)")
         
         # Анализ сообщений по машинам
-        messages_per_machine = {}
-        for message in self.messages:
-            machine_id = message['machine_id']
-            messages_per_machine[machine_id] = messages_per_machine.get(machine_id, 0) + 1
+        messages_per_machine = self._messages_per_machine
         
         if messages_per_machine:
             min_messages = min(messages_per_machine.values())
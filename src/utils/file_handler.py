@@ -3,11 +3,28 @@
 Обработка входных и выходных файлов системы мониторинга
 """
 
+import io
 import json
 import logging
+import math
+from collections import defaultdict
+from datetime import datetime
+from operator import attrgetter, itemgetter
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
+try:
+    import orjson  # Необязательная зависимость для быстрого разбора JSON
+except ImportError:
+    orjson = None
+
+# Шаблоны строк сводного отчета (разбираются один раз, а не для каждой строки)
+_YARD_DETAILS_FORMAT = (
+    "Двор %3d: %5.1f%% убрано (%6.1f/%6.1f м²), статус: %3d%%, время работы: %6.1fс\n"
+)
+_MACHINE_DETAILS_FORMAT = "Машина %3d: %-15s в координатах %-15s, работала в %d дворах\n"
+_STATUS_CHANGE_FORMAT = "  %s%% → %s%% в %s (машина %s)\n"
+
 
 class FileHandler:
     """
@@ -51,42 +68,43 @@ class FileHandler:
         self.logger.debug(f" Чтение справочника дворов из {file_path}")
         
         yards = []
-        line_number = 0
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                for line in file:
-                    line_number += 1
-                    line = line.strip()
-                    
-                    # Пропускаем пустые строки и комментарии
-                    if not line or line.startswith('#'):
-                        continue
+            # Справочник читается целиком одним вызовом, а не построчно
+            lines = file_path.read_text(encoding='utf-8').splitlines()
+            
+            for line_number, line in enumerate(lines, 1):
+                line = line.strip()
+                
+                # Пропускаем пустые строки и комментарии
+                if not line or line.startswith('#'):
+                    continue
+                
+                try:
+                    # Парсим строку (int и float сами отбрасывают пробелы
+                    # вокруг значения, поэтому поля не очищаются отдельно)
+                    parts = line.split(',')
                     
-                    try:
-                        # Парсим строку
-                        parts = [part.strip() for part in line.split(',')]
-                        
-                        if len(parts) != 3:
-                            raise ValueError(
-                                f"Ожидается 3 поля, получено {len(parts)}: {line}"
-                            )
-                        
-                        yard_data = {
-                            'yard_id': int(parts[0]),
-                            'area': float(parts[1]),
-                            'cleaning_speed': float(parts[2])
-                        }
-                        
-                        # Валидация данных
-                        self._validate_yard_data(yard_data)
-                        yards.append(yard_data)
-                        
-                    except (ValueError, IndexError) as e:
-                        self.logger.warning(
-                            f" Ошибка в строке {line_number}: {e}"
+                    if len(parts) != 3:
+                        raise ValueError(
+                            f"Ожидается 3 поля, получено {len(parts)}: {line}"
                         )
-                        continue
+                    
+                    yard_data = {
+                        'yard_id': int(parts[0]),
+                        'area': float(parts[1]),
+                        'cleaning_speed': float(parts[2])
+                    }
+                    
+                    # Валидация данных
+                    self._validate_yard_data(yard_data)
+                    yards.append(yard_data)
+                    
+                except (ValueError, IndexError) as e:
+                    self.logger.warning(
+                        f" Ошибка в строке {line_number}: {e}"
+                    )
+                    continue
         
         except Exception as e:
             self.logger.error(f" Ошибка чтения файла {file_path}: {e}")
@@ -120,8 +138,15 @@ class FileHandler:
         self.logger.debug(f" Чтение сообщений машин из {file_path}")
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                data = json.load(file)
+            with open(file_path, 'rb') as file:
+                raw_data = file.read()
+            
+            # orjson.JSONDecodeError наследуется от json.JSONDecodeError
+            data = orjson.loads(raw_data) if orjson is not None else json.loads(raw_data)
+            
+            # Исходные байты больше не нужны: освобождаем их до валидации,
+            # чтобы в памяти не держались одновременно файл и разобранные сообщения
+            del raw_data
             
             # Проверяем формат данных
             if isinstance(data, dict) and 'messages' in data:
@@ -172,21 +197,25 @@ class FileHandler:
         self.logger.debug(f" Сохранение изменений статусов в {output_path}")
         
         try:
-            with open(output_path, 'w', encoding='utf-8') as file:
-                file.write("# Изменения статусов дворов\n")
-                file.write("# Формат: ID_двора,Статус,Время_изменения\n\n")
-                
-                if not status_changes:
-                    file.write("# Изменений статусов не зафиксировано\n")
-                    return
-                
+            parts = ["# Изменения статусов дворов\n", "# Формат: ID_двора,Статус,Время_изменения\n\n"]
+            
+            if not status_changes:
+                parts.append("# Изменений статусов не зафиксировано\n")
+            else:
                 for change in status_changes:
-                    file.write(
+                    parts.append(
                         f"{change['yard_id']},"
                         f"{change['new_status'].value}%,"
                         f"{change['timestamp']}\n"
                     )
             
+            # Текст кодируется один раз и записывается в двоичном режиме
+            with open(output_path, 'wb') as file:
+                file.write("".join(parts).encode('utf-8'))
+            
+            if not status_changes:
+                return
+            
             self.logger.info(f" Сохранено {len(status_changes)} изменений статусов")
             
         except Exception as e:
@@ -207,18 +236,17 @@ class FileHandler:
         self.logger.debug(f" Сохранение позиций машин в {output_path}")
         
         try:
-            with open(output_path, 'w', encoding='utf-8') as file:
-                file.write("# Финальные позиции машин\n")
-                file.write("# Формат: ID_машины,X,Y,ID_двора\n\n")
-                
-                for machine in machines.values():
-                    yard_id = machine.current_yard_id if machine.current_yard_id else ""
-                    file.write(
-                        f"{machine.machine_id},"
-                        f"{machine.current_coordinates[0]},"
-                        f"{machine.current_coordinates[1]},"
-                        f"{yard_id}\n"
-                    )
+            parts = ["# Финальные позиции машин\n", "# Формат: ID_машины,X,Y,ID_двора\n\n"]
+            append = parts.append
+            get_fields = attrgetter('machine_id', 'current_coordinates', 'current_yard_id')
+            
+            for machine in machines.values():
+                machine_id, (x, y), yard_id = get_fields(machine)
+                append(f"{machine_id},{x},{y},{yard_id if yard_id else ''}\n")
+            
+            # Текст кодируется один раз и записывается в двоичном режиме
+            with open(output_path, 'wb') as file:
+                file.write("".join(parts).encode('utf-8'))
             
             self.logger.info(f" Сохранены позиции {len(machines)} машин")
             
@@ -243,18 +271,63 @@ class FileHandler:
         self.logger.debug(f" Создание сводного отчета в {output_path}")
         
         try:
-            with open(output_path, 'w', encoding='utf-8') as file:
-                self._write_report_header(file)
-                self._write_general_statistics(file, machines, yards, status_changes)
-                self._write_yard_details(file, yards)
-                self._write_machine_details(file, machines)
-                self._write_status_changes_summary(file, status_changes)
+            # Текстовый отчет строится из тех же данных, что и JSON-отчет
+            data = self._build_report_data(machines, yards, status_changes)
+            
+            # Разделы собираются в памяти, затем отчет кодируется один раз
+            # и записывается в двоичном режиме
+            report = io.StringIO()
+            self._write_report_header(report)
+            self._write_general_statistics(report, data['general_statistics'])
+            self._write_yard_details(report, data['yards'])
+            self._write_machine_details(report, data['machines'])
+            self._write_status_changes_summary(report, data['status_changes'])
+            
+            with open(output_path, 'wb') as file:
+                file.write(report.getvalue().encode('utf-8'))
             
             self.logger.info(" Сводный отчет создан")
             
         except Exception as e:
             self.logger.error(f" Ошибка создания отчета: {e}")
             raise
+
+    def save_summary_report_json(self, machines: Dict, yards: Dict,
+                                 status_changes: List, output_file: str):
+        """
+        Сохранение сводного отчета в формате JSON
+        
+        Содержит те же данные, что и текстовый отчет (оба строятся
+        _build_report_data), в виде, удобном для автоматической обработки
+        
+        Args:
+            machines: Словарь машин
+            yards: Словарь дворов
+            status_changes: Список изменений статусов
+            output_file: Путь к файлу отчета
+        """
+        output_path = Path(output_file)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        self.logger.debug(f" Создание JSON-отчета в {output_path}")
+        
+        try:
+            report = self._build_report_data(machines, yards, status_changes)
+            
+            if orjson is not None:
+                payload = orjson.dumps(report, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(report, ensure_ascii=False, indent=2).encode('utf-8')
+            
+            # Документ сериализуется целиком и записывается одним вызовом
+            with open(output_path, 'wb') as file:
+                file.write(payload)
+            
+            self.logger.info(" JSON-отчет создан")
+            
+        except Exception as e:
+            self.logger.error(f" Ошибка создания JSON-отчета: {e}")
+            raise
     
     def _validate_yard_data(self, yard_data: Dict[str, Any]):
         """
@@ -275,11 +348,12 @@ class FileHandler:
         if yard_data['yard_id'] <= 0:
             raise ValueError("ID двора должен быть положительным числом")
         
-        if yard_data['area'] <= 0:
-            raise ValueError("Площадь двора должна быть положительным числом")
+        # float() принимает 'inf' и 'nan', поэтому конечность проверяется отдельно
+        if not math.isfinite(yard_data['area']) or yard_data['area'] <= 0:
+            raise ValueError("Площадь двора должна быть положительным конечным числом")
         
-        if yard_data['cleaning_speed'] <= 0:
-            raise ValueError("Скорость уборки должна быть положительным числом")
+        if not math.isfinite(yard_data['cleaning_speed']) or yard_data['cleaning_speed'] <= 0:
+            raise ValueError("Скорость уборки должна быть положительным конечным числом")
     
     def _validate_message_data(self, message: Dict[str, Any]):
         """
@@ -291,121 +365,191 @@ class FileHandler:
         Raises:
             ValueError: Если данные некорректны
         """
-        required_fields = ['machine_id', 'timestamp', 'x', 'y']
+        if not isinstance(message, dict):
+            raise ValueError("Сообщение должно быть JSON-объектом")
         
-        for field in required_fields:
-            if field not in message:
-                raise ValueError(f"Отсутствует обязательное поле: {field}")
-        
-        if not isinstance(message['machine_id'], int) or message['machine_id'] <= 0:
+        # Каждое поле извлекается из словаря один раз; отсутствующие поля
+        # проверяются в том же порядке, что и раньше
+        try:
+            machine_id = message['machine_id']
+            timestamp = message['timestamp']
+            x = message['x']
+            y = message['y']
+        except KeyError as e:
+            raise ValueError(f"Отсутствует обязательное поле: {e.args[0]}") from None
+        
+        if not isinstance(machine_id, int) or machine_id <= 0:
             raise ValueError("machine_id должен быть положительным целым числом")
         
-        if not isinstance(message['x'], (int, float)):
+        if not isinstance(x, (int, float)):
             raise ValueError("Координата x должна быть числом")
         
-        if not isinstance(message['y'], (int, float)):
+        if not isinstance(y, (int, float)):
             raise ValueError("Координата y должна быть числом")
         
         # Проверяем формат времени
-        if not isinstance(message['timestamp'], str):
+        if not isinstance(timestamp, str):
             raise ValueError("timestamp должен быть строкой")
         
         # Проверяем yard_id если он есть
-        if 'yard_id' in message and message['yard_id'] is not None:
-            if not isinstance(message['yard_id'], int) or message['yard_id'] <= 0:
+        yard_id = message.get('yard_id')
+        if yard_id is not None:
+            if not isinstance(yard_id, int) or yard_id <= 0:
                 raise ValueError("yard_id должен быть положительным целым числом или null")
     
+    def _build_report_data(self, machines: Dict, yards: Dict,
+                           status_changes: List) -> Dict[str, Any]:
+        """
+        Сбор данных сводного отчета
+        
+        Args:
+            machines: Словарь машин
+            yards: Словарь дворов
+            status_changes: Список изменений статусов
+            
+        Returns:
+            Словарь с общей статистикой, данными по дворам, машинам
+            и изменениям статусов
+        """
+        yard_rows = []
+        cleaned_yards = 0
+        partially_cleaned = 0
+        for yard in sorted(yards.values(), key=attrgetter('yard_id')):
+            progress = yard.get_completion_percentage()
+            if yard.is_fully_cleaned():
+                cleaned_yards += 1
+            elif progress > 0:
+                partially_cleaned += 1
+            
+            yard_rows.append({
+                'yard_id': yard.yard_id,
+                'area': yard.area,
+                'cleaned_area': yard.cleaned_area,
+                'completion_percentage': progress,
+                'status': yard.status.value,
+                'total_work_time': yard.total_work_time
+            })
+        
+        machine_rows = []
+        for machine in sorted(machines.values(), key=attrgetter('machine_id')):
+            machine_rows.append({
+                'machine_id': machine.machine_id,
+                'coordinates': list(machine.current_coordinates),
+                'yard_id': machine.current_yard_id,
+                'total_yards_worked': len(machine.yard_work_history)
+            })
+        
+        active_machines = sum(1 for m in machines.values() if m.current_yard_id is not None)
+        
+        return {
+            'general_statistics': {
+                'machines_count': len(machines),
+                'yards_count': len(yards),
+                'status_changes_count': len(status_changes),
+                'active_machines': active_machines,
+                'idle_machines': len(machines) - active_machines,
+                'fully_cleaned_yards': cleaned_yards,
+                'partially_cleaned_yards': partially_cleaned,
+                'untouched_yards': len(yards) - cleaned_yards - partially_cleaned
+            },
+            'yards': yard_rows,
+            'machines': machine_rows,
+            'status_changes': [
+                {
+                    'yard_id': change['yard_id'],
+                    'old_status': change['old_status'].value,
+                    'new_status': change['new_status'].value,
+                    'timestamp': change['timestamp'],
+                    'machine_id': change['machine_id']
+                }
+                for change in status_changes
+            ]
+        }
+    
     def _write_report_header(self, file):
         """Запись заголовка отчета"""
-        from datetime import datetime
-        
         file.write("=" * 60 + "\n")
         file.write("СВОДНЫЙ ОТЧЕТ СИСТЕМЫ МОНИТОРИНГА УБОРОЧНЫХ МАШИН\n")
         file.write("=" * 60 + "\n")
         file.write(f"Дата создания: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
     
-    def _write_general_statistics(self, file, machines, yards, status_changes):
+    def _write_general_statistics(self, file, stats: Dict[str, int]):
         """Запись общей статистики"""
         file.write("ОБЩАЯ СТАТИСТИКА\n")
         file.write("-" * 20 + "\n")
-        file.write(f"Общее количество машин: {len(machines)}\n")
-        file.write(f"Общее количество дворов: {len(yards)}\n")
-        file.write(f"Изменений статусов: {len(status_changes)}\n")
+        file.write(f"Общее количество машин: {stats['machines_count']}\n")
+        file.write(f"Общее количество дворов: {stats['yards_count']}\n")
+        file.write(f"Изменений статусов: {stats['status_changes_count']}\n")
         
         # Статистика по машинам
-        active_machines = sum(1 for m in machines.values() if m.current_yard_id is not None)
-        file.write(f"Активных машин: {active_machines}\n")
-        file.write(f"Простаивающих машин: {len(machines) - active_machines}\n")
+        file.write(f"Активных машин: {stats['active_machines']}\n")
+        file.write(f"Простаивающих машин: {stats['idle_machines']}\n")
         
         # Статистика по дворам
-        cleaned_yards = sum(1 for y in yards.values() if y.is_fully_cleaned())
-        partially_cleaned = sum(1 for y in yards.values() 
-                              if y.get_completion_percentage() > 0 and not y.is_fully_cleaned())
-        untouched = len(yards) - cleaned_yards - partially_cleaned
-        
-        file.write(f"Полностью убранных дворов: {cleaned_yards}\n")
-        file.write(f"Частично убранных дворов: {partially_cleaned}\n")
-        file.write(f"Нетронутых дворов: {untouched}\n\n")
+        file.write(f"Полностью убранных дворов: {stats['fully_cleaned_yards']}\n")
+        file.write(f"Частично убранных дворов: {stats['partially_cleaned_yards']}\n")
+        file.write(f"Нетронутых дворов: {stats['untouched_yards']}\n\n")
     
-    def _write_yard_details(self, file, yards):
+    def _write_yard_details(self, file, yard_rows: List[Dict[str, Any]]):
         """Запись детальной информации по дворам"""
-        file.write("ДЕТАЛИ ПО ДВОРАМ\n")
-        file.write("-" * 20 + "\n")
-        
-        for yard in sorted(yards.values(), key=lambda y: y.yard_id):
-            progress = yard.get_completion_percentage()
-            file.write(
-                f"Двор {yard.yard_id:3d}: {progress:5.1f}% убрано "
-                f"({yard.cleaned_area:6.1f}/{yard.area:6.1f} м²), "
-                f"статус: {yard.status.value:3d}%, "
-                f"время работы: {yard.total_work_time:6.1f}с\n"
-            )
-        file.write("\n")
+        parts = ["ДЕТАЛИ ПО ДВОРАМ\n", "-" * 20 + "\n"]
+        append = parts.append
+        get_fields = itemgetter(
+            'yard_id', 'completion_percentage', 'cleaned_area', 'area', 'status', 'total_work_time'
+        )
+        
+        for row in yard_rows:
+            append(_YARD_DETAILS_FORMAT % get_fields(row))
+        parts.append("\n")
+        
+        # Раздел записывается одним вызовом
+        file.write("".join(parts))
     
-    def _write_machine_details(self, file, machines):
+    def _write_machine_details(self, file, machine_rows: List[Dict[str, Any]]):
         """Запись детальной информации по машинам"""
-        file.write("ДЕТАЛИ ПО МАШИНАМ\n")
-        file.write("-" * 20 + "\n")
-        
-        for machine in sorted(machines.values(), key=lambda m: m.machine_id):
-            status_info = machine.get_current_status()
-            location = f"двор {machine.current_yard_id}" if machine.current_yard_id else "вне дворов"
-            coords = f"({machine.current_coordinates[0]}, {machine.current_coordinates[1]})"
+        parts = ["ДЕТАЛИ ПО МАШИНАМ\n", "-" * 20 + "\n"]
+        append = parts.append
+        get_fields = itemgetter('machine_id', 'yard_id', 'coordinates', 'total_yards_worked')
+        
+        for row in machine_rows:
+            machine_id, yard_id, (x, y), total_yards_worked = get_fields(row)
+            location = f"двор {yard_id}" if yard_id else "вне дворов"
+            coords = f"({x}, {y})"
             
-            file.write(
-                f"Машина {machine.machine_id:3d}: {location:15s} "
-                f"в координатах {coords:15s}, "
-                f"работала в {status_info['total_yards_worked']} дворах\n"
-            )
-        file.write("\n")
+            append(_MACHINE_DETAILS_FORMAT % (machine_id, location, coords, total_yards_worked))
+        parts.append("\n")
+        
+        # Раздел записывается одним вызовом
+        file.write("".join(parts))
     
-    def _write_status_changes_summary(self, file, status_changes):
+    def _write_status_changes_summary(self, file, change_rows: List[Dict[str, Any]]):
         """Запись сводки изменений статусов"""
         file.write("ИЗМЕНЕНИЯ СТАТУСОВ\n")
         file.write("-" * 20 + "\n")
         
-        if not status_changes:
+        if not change_rows:
             file.write("Изменений статусов не зафиксировано\n")
             return
         
         # Группируем изменения по дворам
-        changes_by_yard = {}
-        for change in status_changes:
-            yard_id = change['yard_id']
-            if yard_id not in changes_by_yard:
-                changes_by_yard[yard_id] = []
-            changes_by_yard[yard_id].append(change)
+        changes_by_yard = defaultdict(list)
+        for change in change_rows:
+            changes_by_yard[change['yard_id']].append(change)
         
+        parts = []
         for yard_id in sorted(changes_by_yard.keys()):
             changes = changes_by_yard[yard_id]
-            file.write(f"Двор {yard_id}: {len(changes)} изменений статуса\n")
+            parts.append(f"Двор {yard_id}: {len(changes)} изменений статуса\n")
             
             for change in changes:
-                file.write(
-                    f"  {change['old_status'].value}% → {change['new_status'].value}% "
-                    f"в {change['timestamp'][:19]} (машина {change['machine_id']})\n"
-                )
-        file.write("\n")
+                parts.append(_STATUS_CHANGE_FORMAT % (
+                    change['old_status'], change['new_status'],
+                    change['timestamp'][:19], change['machine_id']
+                ))
+        parts.append("\n")
+        
+        # Раздел записывается одним вызовом
+        file.write("".join(parts))
     
     def backup_file(self, file_path: str, backup_suffix: str = ".backup") -> Optional[str]:
         """